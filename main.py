@@ -17,7 +17,7 @@ sys.path.insert(0, HERE)
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QSettings
 
-from src.ui.theme import QSS, set_theme
+from src.ui.theme import apply_qss, set_theme
 
 
 def main():
@@ -34,8 +34,7 @@ def main():
     if saved in ("dark", "light", "midnight"):
         set_theme(saved)
 
-    from src.ui.theme import QSS as CURRENT_QSS
-    app.setStyleSheet(CURRENT_QSS)
+    apply_qss(app)
 
     from src.ui.app import QuelldexWindow
     window = QuelldexWindow()
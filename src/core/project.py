@@ -70,13 +70,31 @@ IGNORE_DIRS = {
     "Pods",          # iOS
 }
 
+# ext (or bare file name) -> category; built in reverse so the first
+# category listing an ext wins, matching the old linear scan
+_EXT_CATEGORY = {ext: cat for cat, info in reversed(CATEGORIES.items())
+                 for ext in info["ext"]}
+
+DATA_EXTS = frozenset({".csv", ".tsv", ".json", ".xlsx", ".xls"})
+CODE_EXTS = frozenset(CATEGORIES["Source Code"]["ext"])
+
+
+def file_suffix(filepath: str) -> str:
+    """Same result as Path(filepath).suffix.lower(), via plain string scans.
+    Called per file during scans, where Path construction dominates."""
+    dot = filepath.rfind(".")
+    sep = max(filepath.rfind("/"), filepath.rfind("\\"))
+    if dot <= sep + 1 or dot == len(filepath) - 1:  # none, dotfile, or "name."
+        return ""
+    return filepath[dot:].lower()
+
+
 def classify_file(filepath: str) -> str:
-    ext = Path(filepath).suffix.lower()
-    name = Path(filepath).name.lower()
-    for cat, info in CATEGORIES.items():
-        if ext in info["ext"] or name in info["ext"]:
-            return cat
-    return "Other"
+    ext = file_suffix(filepath)
+    if ext in _EXT_CATEGORY:
+        return _EXT_CATEGORY[ext]
+    name = filepath[max(filepath.rfind("/"), filepath.rfind("\\")) + 1:].lower()
+    return _EXT_CATEGORY.get(name, "Other")
 
 
 def get_category_info(category: str) -> dict:
@@ -84,13 +102,11 @@ def get_category_info(category: str) -> dict:
 
 
 def is_data_file(filepath: str) -> bool:
-    ext = Path(filepath).suffix.lower()
-    return ext in {".csv", ".tsv", ".json", ".xlsx", ".xls"}
+    return file_suffix(filepath) in DATA_EXTS
 
 
 def is_code_file(filepath: str) -> bool:
-    ext = Path(filepath).suffix.lower()
-    return ext in CATEGORIES["Source Code"]["ext"]
+    return file_suffix(filepath) in CODE_EXTS
 
 
 # -- Cached File Scanner ------------------------------------------
@@ -396,15 +412,16 @@ class Project:
         ]
         self.save()
 
-    def merge_tasks_from_branch(self, source_branch: str, target_branch: str):
-        """Copy branch-specific tasks from source to target (skip duplicates by title)."""
+    def merge_tasks_from_branch(self, source_branch: str, target_branch: str) -> list:
+        """Copy branch-specific tasks from source to target (skip duplicates by title).
+        Returns the newly created task dicts."""
         self._ensure_planner()
         source_tasks = [t for t in self.data["planner"]["tasks"]
                         if t.get("scope") == source_branch]
         target_titles = {t["title"] for t in self.data["planner"]["tasks"]
                          if t.get("scope") in (target_branch, "*")}
         import uuid
-        merged = 0
+        merged = []
         for st in source_tasks:
             if st["title"] not in target_titles:
                 new_task = dict(st)
@@ -412,6 +429,6 @@ class Project:
                 new_task["scope"] = target_branch
                 new_task["updated_at"] = time.time()
                 self.data["planner"]["tasks"].append(new_task)
-                merged += 1
+                merged.append(new_task)
         self.save()
         return merged
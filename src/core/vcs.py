@@ -267,16 +267,16 @@ class VCS:
         data = self._read_object(c["snapshot"])
         return json.loads(data.decode()) if data else None
 
-    def get_history(self, branch: str = None, limit: int = 200) -> list:
+    def get_history(self, branch: str = None, limit: int = 200, offset: int = 0) -> list:
         db = self._get_db()
         if branch:
             rows = db.execute(
-                "SELECT * FROM commits WHERE branch = ? ORDER BY timestamp DESC LIMIT ?",
-                (branch, limit)
+                "SELECT * FROM commits WHERE branch = ? ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                (branch, limit, offset)
             ).fetchall()
         else:
             rows = db.execute(
-                "SELECT * FROM commits ORDER BY timestamp DESC LIMIT ?", (limit,)
+                "SELECT * FROM commits ORDER BY timestamp DESC LIMIT ? OFFSET ?", (limit, offset)
             ).fetchall()
         return [dict(r) for r in rows]
 
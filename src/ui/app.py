@@ -6,8 +6,13 @@ Multi-project workspace · Collapsible tree · Elegant minimalist UI
 import sys
 import os
 import json
+import html
+import bisect
+import mmap
 from pathlib import Path
+import operator
 from functools import partial
+from itertools import cycle
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -32,7 +37,7 @@ if str(_SRC.parent) not in sys.path:
 from src.core.vcs import VCS
 from src.core.project import (
     Project, classify_file, get_category_info, is_data_file, is_code_file,
-    scan_directory,
+    file_suffix, scan_directory,
 )
 
 
@@ -66,6 +71,59 @@ class _FileScanWorker(QThread):
             self.finished.emit(self._path, files)
         except Exception:
             self.finished.emit(self._path, [])
+
+
+# History rows fetched per page; more are paged in on scroll
+_HIST_PAGE = 200
+
+
+def _collect_vcs_state(vcs: VCS) -> dict:
+    """Everything the VCS view displays, gathered in one pass."""
+    return {
+        "branches": vcs.get_branches(),
+        "current": vcs.get_current_branch(),
+        "changes": vcs.get_working_changes(),
+        "history": vcs.get_history(limit=_HIST_PAGE),
+        "tags": vcs.get_tags(),
+    }
+
+
+class _VCSRefreshWorker(QThread):
+    """Collects VCS view state in a background thread.
+    Opens its own VCS handle: sqlite connections are bound to their thread."""
+    refreshed = Signal(str, int, dict)  # (project_path, seq, state)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._path = None
+        self._seq = 0
+        self._dirty = False
+        # A request that arrives while running is picked up on completion
+        self.finished.connect(self._restart_if_dirty)
+
+    def refresh(self, path: str, seq: int):
+        self._path, self._seq = path, seq
+        self._dirty = True
+        if not self.isRunning():
+            self.start()
+
+    def _restart_if_dirty(self):
+        if self._dirty:
+            self.start()
+
+    def run(self):
+        while self._dirty:
+            self._dirty = False
+            path, seq = self._path, self._seq
+            vcs = VCS(path)
+            try:
+                self.refreshed.emit(path, seq, _collect_vcs_state(vcs))
+            except Exception:
+                pass
+            finally:
+                vcs.close()
+
+
 from src.viz.data_viewer import (
     load_data_file, compute_column_stats, compute_cross_file_stats,
     histogram_data, scatter_data, bar_data, line_data, multi_line_data,
@@ -74,7 +132,7 @@ from src.viz.data_viewer import (
 from src.integrations.bridges import IDELauncher, ExternalToolBridge
 from src.ui.theme import (
     C, PALETTE, QSS, MONO_FAMILY,
-    format_size, format_time, set_theme, get_current_theme, get_theme_names,
+    format_size, format_time, set_theme, get_current_theme, get_theme_names, apply_qss,
 )
 from src.ui.widgets import (
     ChartWidget, TagChip, StatCard, IconFactory, LoadingSpinner, DiffViewer,
@@ -85,6 +143,23 @@ from src.ui.widgets import (
 #  Helpers
 # ================================================================
 
+# Binary image formats skipped by the Compare view (.svg is text, so kept)
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp",
+                         ".ico", ".tiff", ".psd", ".ai", ".eps"})
+
+# Planner sort rank; unknown priorities sink below "low"
+_PRIO_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+_PRIO_CHOICES = ("medium", "high", "critical", "low")   # dialog order, default first
+_PLAN_CARD_CAP = 50   # cards per Kanban column page ("Show more" adds another)
+_SETTINGS_ROW_CAP = 50   # workspace/shelf rows listed before "show more"
+_READ_BLOCK = 1 << 20    # bytes decoded at a time by _read_lines
+
+
+def _plan_sort_key(task: dict) -> tuple:
+    """Kanban order: priority first, most recently updated first within it."""
+    return (_PRIO_ORDER.get(task.get("priority"), 9), -task.get("updated_at", 0))
+
+
 def _btn(text, obj_name="", tooltip="") -> QPushButton:
     b = QPushButton(text)
     if obj_name: b.setObjectName(obj_name)
@@ -124,6 +199,29 @@ def _divider() -> QFrame:
 def _spacer(h: int) -> QSpacerItem:
     return QSpacerItem(0, h, QSizePolicy.Minimum, QSizePolicy.Fixed)
 
+def _read_lines(path: Path) -> list:
+    """Read a text file as lines, same as read_text().splitlines(), but
+    decoding an mmap of it a block at a time so the whole file never
+    exists as one str next to the list of lines."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []  # mmap refuses empty files
+        lines = []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = start + _READ_BLOCK
+                if end < size:
+                    # Cut just past a \n: never inside a UTF-8 sequence or a \r\n pair
+                    cut = mm.rfind(b'\n', start, end)
+                    if cut < 0:
+                        cut = mm.find(b'\n', end)
+                    end = size if cut < 0 else cut + 1
+                lines += str(mm[start:end], 'utf-8', 'replace').splitlines()
+                start = end
+        return lines
+
 
 class _DiamondIcon(QWidget):
     """Minimal diamond icon for the welcome page."""
@@ -289,10 +387,17 @@ class QuelldexWindow(QMainWindow):
         self._current_view = None
         self._tree_collapsed = {}  # path -> set of collapsed folder keys
         self._scan_pending = False
+        self._task_cache = {}   # planner scope -> task list (until next mutation)
+        self._task_by_id = {}   # task id -> task, rebuilt with the unscoped list
+        self._planner_refresh_pending = False
+        self._settings_seq = 0  # bumps per settings build; stale deferred builds bail
 
         # Background file scanner
         self._scanner = _FileScanWorker(self)
         self._scanner.finished.connect(self._on_scan_finished)
+        self._vcs_worker = _VCSRefreshWorker(self)
+        self._vcs_worker.refreshed.connect(self._on_vcs_refreshed)
+        self._vcs_edit_seq = 0  # bumped per optimistic edit; older results are stale
 
         # Restore saved theme
         saved_theme = QSettings("Quelldex", "Quelldex").value("theme", "dark")
@@ -888,6 +993,9 @@ class QuelldexWindow(QMainWindow):
 
         # Auto-collapse all categories on first load of large sets
         auto_collapse = len(files) > self._AUTO_COLLAPSE_THRESHOLD and not query
+        # Render every file icon color up front in one painter pass
+        IconFactory.warm_file_icons(
+            get_category_info(cat)["color"] for cat in {f["category"] for f in files})
 
         if mode == "category":
             groups = {}
@@ -1108,8 +1216,12 @@ class QuelldexWindow(QMainWindow):
         self._hist_tree.setColumnWidth(1, 110)
         self._hist_tree.setColumnWidth(2, 70)
         self._hist_tree.setColumnWidth(3, 150)
+        self._hist_tree.setUniformRowHeights(True)
         self._hist_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self._hist_tree.customContextMenuRequested.connect(self._history_context_menu)
+        self._hist_loaded = 0
+        self._hist_more = False
+        self._hist_tree.verticalScrollBar().valueChanged.connect(self._on_hist_scroll)
         hl.addWidget(self._hist_tree)
         tabs.addTab(hw, "  History  ")
 
@@ -1145,20 +1257,35 @@ class QuelldexWindow(QMainWindow):
         self._spinner.start("Checking changes...")
         self._spinner.move(self.width() // 2 - 60, self.height() // 2 - 20)
         QApplication.processEvents()
+        self._apply_vcs_state(_collect_vcs_state(vcs))
+        self._spinner.stop()
 
-        branches = vcs.get_branches()
-        current = vcs.get_current_branch()
+    def _refresh_vcs_async(self):
+        """Reconcile the VCS view in the background (after optimistic edits)."""
+        if self.ws.vcs and hasattr(self, '_hist_tree'):
+            self._vcs_worker.refresh(self.ws.active_path, self._vcs_edit_seq)
+
+    def _on_vcs_refreshed(self, path: str, seq: int, state: dict):
+        # Drop stale results: predates an edit, project switched, or view torn down
+        if seq != self._vcs_edit_seq:
+            return
+        if path != self.ws.active_path or self._current_view != "vcs":
+            return
+        if not hasattr(self, '_hist_tree'):
+            return
+        self._apply_vcs_state(state)
+
+    def _apply_vcs_state(self, state: dict):
+        current = state["current"]
         self._branch_combo.blockSignals(True)
         self._branch_combo.clear()
-        for b in branches:
+        for b in state["branches"]:
             self._branch_combo.addItem(b["name"])
         if current:
             self._branch_combo.setCurrentText(current)
         self._branch_combo.blockSignals(False)
 
-        changes = vcs.get_working_changes()
-        QApplication.processEvents()
-
+        changes = state["changes"]
         na, nm, nr = len(changes["added"]), len(changes["modified"]), len(changes["removed"])
         self._changes_text.clear()
         if na + nm + nr == 0:
@@ -1175,21 +1302,33 @@ class QuelldexWindow(QMainWindow):
 
         self._hist_tree.setUpdatesEnabled(False)
         self._hist_tree.clear()
-        for c in vcs.get_history():
-            QTreeWidgetItem(self._hist_tree, [
-                c["message"], c["branch"], c["author"],
-                format_time(c["timestamp"]), c["id"]])
+        self._hist_loaded = 0
+        self._add_history_page(state["history"])
         self._hist_tree.setUpdatesEnabled(True)
 
         self._tags_tree.setUpdatesEnabled(False)
         self._tags_tree.clear()
-        for t in vcs.get_tags():
+        for t in state["tags"]:
             QTreeWidgetItem(self._tags_tree, [
                 t["name"], t["description"], t["commit_id"],
                 format_time(t["created_at"])])
         self._tags_tree.setUpdatesEnabled(True)
 
-        self._spinner.stop()
+    def _add_history_page(self, commits: list):
+        for c in commits:
+            QTreeWidgetItem(self._hist_tree, [
+                c["message"], c["branch"], c["author"],
+                format_time(c["timestamp"]), c["id"]])
+        self._hist_loaded += len(commits)
+        self._hist_more = len(commits) == _HIST_PAGE
+
+    def _on_hist_scroll(self, value):
+        """Page in older commits once the user nears the bottom."""
+        sb = self._hist_tree.verticalScrollBar()
+        if not self._hist_more or not self.ws.vcs or value < sb.maximum() * 0.9:
+            return
+        self._add_history_page(
+            self.ws.vcs.get_history(limit=_HIST_PAGE, offset=self._hist_loaded))
 
     def _on_branch_switch(self, name):
         if name and self.ws.vcs:
@@ -1202,7 +1341,16 @@ class QuelldexWindow(QMainWindow):
             cid = self.ws.vcs.commit(msg)
             if cid:
                 self.ws.project.invalidate_cache()
-                self._refresh_vcs()
+                # Optimistic: show the commit now, reconcile in the background
+                self._vcs_edit_seq += 1
+                # Row values come from the stored commit, so the reconcile doesn't change them
+                c = self.ws.vcs.get_commit(cid)
+                if c and hasattr(self, '_hist_tree'):
+                    self._hist_tree.insertTopLevelItem(0, QTreeWidgetItem([
+                        c["message"], c["branch"], c["author"],
+                        format_time(c["timestamp"]), c["id"]]))
+                    self._hist_loaded += 1  # keep the paging offset aligned
+                QTimer.singleShot(0, self._refresh_vcs_async)
                 self.status.showMessage(f"Committed: {cid[:12]}", 3000)
             else:
                 QMessageBox.information(self, "Info", "Nothing to commit")
@@ -1211,7 +1359,13 @@ class QuelldexWindow(QMainWindow):
         name, ok = QInputDialog.getText(self, "New Branch", "Branch name:")
         if ok and name and self.ws.vcs:
             if self.ws.vcs.create_branch(name):
-                self._refresh_vcs()
+                # Optimistic: list the branch now, reconcile in the background
+                self._vcs_edit_seq += 1
+                if hasattr(self, '_branch_combo'):
+                    self._branch_combo.blockSignals(True)
+                    self._branch_combo.addItem(name)
+                    self._branch_combo.blockSignals(False)
+                QTimer.singleShot(0, self._refresh_vcs_async)
             else:
                 QMessageBox.warning(self, "Error", "Branch already exists")
 
@@ -1342,6 +1496,9 @@ class QuelldexWindow(QMainWindow):
         # Chips
         self._chips_layout = QHBoxLayout()
         self._chips_layout.setAlignment(Qt.AlignLeft)
+        self._chips_empty = _label("No datasets loaded", C["fg_dim"], 12)
+        self._chips_layout.addWidget(self._chips_empty)
+        self._chip_widgets = {}  # dataset name -> TagChip
         layout.addLayout(self._chips_layout)
         self._refresh_chips()
 
@@ -1375,9 +1532,11 @@ class QuelldexWindow(QMainWindow):
         for i, (text, _) in enumerate(charts):
             rb = QRadioButton(text)
             rb.setChecked(i == 0)
-            rb.toggled.connect(lambda *a: self._render_chart())
             self._chart_type_group.addButton(rb, i)
             cl.addWidget(rb)
+        # One signal per user click (toggled fires twice: old off + new on)
+        self._chart_types = tuple(ct for _, ct in charts)
+        self._chart_type_group.idClicked.connect(lambda _id: self._render_chart())
 
         cl.addSpacing(6)
         draw_btn = _btn("Draw", "accent")
@@ -1400,14 +1559,19 @@ class QuelldexWindow(QMainWindow):
     def _refresh_chips(self):
         if not hasattr(self, '_chips_layout'):
             return
-        while self._chips_layout.count():
-            item = self._chips_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-        for i, name in enumerate(self.loaded_datasets):
-            chip = TagChip(name, PALETTE[i % len(PALETTE)])
-            self._chips_layout.addWidget(chip)
-        if not self.loaded_datasets:
-            self._chips_layout.addWidget(_label("No datasets loaded", C["fg_dim"], 12))
+        # Diff against the chips already shown — only touch what changed
+        for name in set(self._chip_widgets) - set(self.loaded_datasets):
+            chip = self._chip_widgets.pop(name)
+            self._chips_layout.removeWidget(chip)
+            chip.deleteLater()
+        for name, color in zip(self.loaded_datasets, cycle(PALETTE)):
+            if name not in self._chip_widgets:
+                chip = TagChip(name, color)
+                self._chips_layout.addWidget(chip)
+                self._chip_widgets[name] = chip
+        empty = not self.loaded_datasets
+        if self._chips_empty.isHidden() == empty:
+            self._chips_empty.setHidden(not empty)
 
     def _load_data_dialog(self):
         fp, _ = QFileDialog.getOpenFileName(
@@ -1425,7 +1589,7 @@ class QuelldexWindow(QMainWindow):
     def _load_data_from_project(self):
         if not self.ws.has_active:
             return
-        data_files = [f for f in self.ws.project.get_all_files() if is_data_file(f["path"])]
+        data_files = [f for f in self.ws.project.get_all_files() if f["is_data"]]
         if not data_files:
             QMessageBox.information(self, "Info", "No data files found in project")
             return
@@ -1440,6 +1604,11 @@ class QuelldexWindow(QMainWindow):
                 self._populate_viz_combos()
 
     def _clear_datasets(self):
+        for ds in self.loaded_datasets.values():
+            ds["_stats_cache"] = {}
+            ds["_corr_cache"] = None
+            ds["_numeric_cache"] = {}
+            ds["_counts_cache"] = {}
         self.loaded_datasets.clear()
         self._refresh_chips()
         if hasattr(self, '_chart'):
@@ -1463,8 +1632,7 @@ class QuelldexWindow(QMainWindow):
     def _render_chart(self):
         if not self.loaded_datasets or not hasattr(self, '_chart'):
             return
-        chart_types = ["auto", "histogram", "line", "bar", "scatter", "corr", "multi_line"]
-        ct = chart_types[self._chart_type_group.checkedId()]
+        ct = self._chart_types[self._chart_type_group.checkedId()]
         col_text = self._viz_col.currentText()
         if not col_text:
             return
@@ -1476,8 +1644,8 @@ class QuelldexWindow(QMainWindow):
         if not ds:
             return
         if ct == "auto":
-            st = compute_column_stats(ds, col)
-            ct = "histogram" if st.get("numeric") else "bar"
+            # Decided from the load-time type detection, no need to compute column stats
+            ct = "histogram" if ds["dtypes"].get(col) == "numeric" else "bar"
         if ct == "histogram":
             data = histogram_data(ds, col)
             self._chart.set_chart("histogram", data, f"{col} Distribution")
@@ -1497,12 +1665,22 @@ class QuelldexWindow(QMainWindow):
                         data = scatter_data(ds, col, ds2, p2[1])
                         self._chart.set_chart("scatter", data, f"{col} vs {p2[1]}")
         elif ct == "corr":
-            data = correlation_matrix(ds)
+            if ds.get("_corr_cache") is None:
+                ds["_corr_cache"] = correlation_matrix(ds)
+            data = ds["_corr_cache"]
             self._chart.set_chart("corr", data, "Correlation Matrix")
         elif ct == "multi_line":
             data = multi_line_data(list(self.loaded_datasets.values()), col)
             self._chart.set_chart("multi_line", data, f"{col} Across Files")
 
+    def _column_stats(self, ds: dict, col: str) -> dict:
+        """Column stats memoized on the dataset until it is reloaded."""
+        cache = ds.setdefault("_stats_cache", {})
+        if col not in cache:
+            # The panel never shows the unique count; skipping it spares numeric columns a hashing pass
+            cache[col] = compute_column_stats(ds, col, unique=False)
+        return cache[col]
+
     def _on_viz_col_change(self, text):
         if not text or not hasattr(self, '_stats_text'):
             return
@@ -1511,11 +1689,11 @@ class QuelldexWindow(QMainWindow):
             return
         ds = self.loaded_datasets.get(parts[0])
         if ds:
-            st = compute_column_stats(ds, parts[1])
+            st = self._column_stats(ds, parts[1])
             lines = [f"Column: {parts[1]}", f"Count:   {st.get('count', 0)}",
-                     f"Nulls:   {st.get('null_count', 0)}"]
-            if st.get("numeric"):
-                lines += [f"\nMean:    {st.get('mean', 0):.4f}", f"Std:     {st.get('std', 0):.4f}",
+                     f"Nulls:   {st.get('empty', 0)}"]
+            if st.get("type") == "numeric":
+                lines += [f"\nMean:    {st.get('mean', 0):.4f}", f"Std:     {st.get('stdev', 0):.4f}",
                           f"Min:     {st.get('min', 0):.4f}", f"Median:  {st.get('median', 0):.4f}",
                           f"Max:     {st.get('max', 0):.4f}", f"Q1:      {st.get('q1', 0):.4f}",
                           f"Q3:      {st.get('q3', 0):.4f}"]
@@ -1597,14 +1775,9 @@ class QuelldexWindow(QMainWindow):
         if not self.ws.has_active:
             return
         files = self.ws.project.get_all_files()
-        text_exts = set()
-        for cat_info in __import__('src.core.project', fromlist=['CATEGORIES']).CATEGORIES.values():
-            text_exts |= cat_info["ext"]
         # Filter to text-likely files (not images)
-        img_exts = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp",
-                    ".ico", ".tiff", ".psd", ".ai", ".eps"}
-        text_files = [f["path"] for f in files if
-                      Path(f["path"]).suffix.lower() not in img_exts]
+        text_files = [f["path"] for f in files
+                      if file_suffix(f["path"]) not in _IMAGE_EXTS]
 
         for combo in [self._cmp_left, self._cmp_right, self._cmp_ver_file]:
             combo.clear()
@@ -1631,8 +1804,8 @@ class QuelldexWindow(QMainWindow):
         right_full = self.ws.project.path / right_path
 
         try:
-            left_lines = left_full.read_text(encoding='utf-8', errors='replace').splitlines()
-            right_lines = right_full.read_text(encoding='utf-8', errors='replace').splitlines()
+            left_lines = _read_lines(left_full)
+            right_lines = _read_lines(right_full)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Cannot read files: {e}")
             return
@@ -1653,7 +1826,7 @@ class QuelldexWindow(QMainWindow):
         # Read current version
         full = self.ws.project.path / file_path
         try:
-            current_lines = full.read_text(encoding='utf-8', errors='replace').splitlines()
+            current_lines = _read_lines(full)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Cannot read file: {e}")
             return
@@ -1728,6 +1901,7 @@ class QuelldexWindow(QMainWindow):
         hdr.addWidget(_label("Scope:", C["fg_dim"], 12))
         self._plan_scope = QComboBox()
         self._plan_scope.setMinimumWidth(160)
+        self._plan_scope.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
         self._plan_scope.currentIndexChanged.connect(lambda: self._refresh_planner())
         hdr.addWidget(self._plan_scope)
 
@@ -1770,6 +1944,10 @@ class QuelldexWindow(QMainWindow):
             task_layout = QVBoxLayout(task_widget)
             task_layout.setContentsMargins(0, 0, 0, 0)
             task_layout.setSpacing(6)
+            footer = _btn("", "ghost")
+            footer.setVisible(False)
+            footer.clicked.connect(partial(self._show_more_tasks, status_id))
+            task_layout.addWidget(footer)
             task_layout.addStretch()
             scroll.setWidget(task_widget)
             cl.addWidget(scroll, 1)
@@ -1777,7 +1955,7 @@ class QuelldexWindow(QMainWindow):
             cols.addWidget(col, 1)
             self._plan_cols[status_id] = {
                 "frame": col, "layout": task_layout,
-                "count_lbl": count_lbl, "scroll": scroll,
+                "count_lbl": count_lbl, "scroll": scroll, "footer": footer,
             }
         layout.addLayout(cols, 1)
 
@@ -1788,10 +1966,12 @@ class QuelldexWindow(QMainWindow):
         merge_bar.addWidget(_label("from", C["fg_dim"], 12))
         self._plan_merge_src = QComboBox()
         self._plan_merge_src.setMinimumWidth(140)
+        self._plan_merge_src.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
         merge_bar.addWidget(self._plan_merge_src)
         merge_bar.addWidget(_label("into", C["fg_dim"], 12))
         self._plan_merge_dst = QComboBox()
         self._plan_merge_dst.setMinimumWidth(140)
+        self._plan_merge_dst.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
         merge_bar.addWidget(self._plan_merge_dst)
         merge_btn = _btn("Merge")
         merge_btn.clicked.connect(self._planner_merge)
@@ -1799,155 +1979,301 @@ class QuelldexWindow(QMainWindow):
         merge_bar.addStretch()
         layout.addLayout(merge_bar)
 
+        self._card_widgets = {}  # task id -> card + label handles
+        self._plan_caps = {sid: _PLAN_CARD_CAP for sid in self._plan_cols}  # cards drawn per column
+        self._last_branch_sig = None  # branch names the dropdowns were built from
+        self._last_planner_sig = None  # (id, status, priority, updated_at) on the board
+        self._plan_stats_scope = None
+        self._invalidate_task_cache()  # may be a different project
+        self._refresh_planner()
+
+    def _invalidate_task_cache(self):
+        self._task_cache.clear()
+        self._task_by_id = {}
+
+    def _planner_tasks(self, scope) -> list:
+        """Tasks for a scope, fetched once until the next planner mutation."""
+        tasks = self._task_cache.get(scope)
+        if tasks is None:
+            tasks = self._task_cache[scope] = self.ws.project.get_tasks(scope=scope)
+            if scope is None:
+                self._task_by_id = {t["id"]: t for t in tasks}
+        return tasks
+
+    def _planner_task(self, task_id: str):
+        if None not in self._task_cache:
+            self._planner_tasks(None)
+        return self._task_by_id.get(task_id)
+
+    def _schedule_planner_refresh(self):
+        """Coalesce refresh requests from planner mutators into one per tick."""
+        if not self._planner_refresh_pending:
+            self._planner_refresh_pending = True
+            QTimer.singleShot(0, self._do_planner_refresh)
+
+    def _do_planner_refresh(self):
+        self._planner_refresh_pending = False
         self._refresh_planner()
 
     def _refresh_planner(self):
         if not self.ws.has_active or not hasattr(self, '_plan_cols'):
             return
-        proj = self.ws.project
 
-        # Update scope dropdown
-        self._plan_scope.blockSignals(True)
-        old_scope = self._plan_scope.currentData()
-        self._plan_scope.clear()
-        self._plan_scope.addItem("All Tasks", None)
-        self._plan_scope.addItem("Shared (all branches)", "*")
-        if self.ws.vcs:
-            for b in self.ws.vcs.get_branches():
-                self._plan_scope.addItem(f"Branch: {b['name']}", b['name'])
-        # Restore selection
-        for i in range(self._plan_scope.count()):
-            if self._plan_scope.itemData(i) == old_scope:
-                self._plan_scope.setCurrentIndex(i)
-                break
-        self._plan_scope.blockSignals(False)
-
-        # Update merge combos
-        if hasattr(self, '_plan_merge_src'):
+        # Branches rarely change between task edits, so the scope and merge
+        # dropdowns are only repopulated when the branch list differs
+        sig = tuple(b['name'] for b in self.ws.vcs.get_branches()) if self.ws.vcs else ()
+        if sig != self._last_branch_sig:
+            self._last_branch_sig = sig
+
+            # Update scope dropdown
+            self._plan_scope.blockSignals(True)
+            old_scope = self._plan_scope.currentData()
+            self._plan_scope.clear()
+            self._plan_scope.addItem("All Tasks", None)
+            self._plan_scope.addItem("Shared (all branches)", "*")
+            self._plan_scope.addItems([f"Branch: {name}" for name in sig])
+            for i, name in enumerate(sig, 2):
+                self._plan_scope.setItemData(i, name)
+            # Restore selection
+            for i in range(self._plan_scope.count()):
+                if self._plan_scope.itemData(i) == old_scope:
+                    self._plan_scope.setCurrentIndex(i)
+                    break
+            self._plan_scope.blockSignals(False)
+
+            # Update merge combos
             for combo in (self._plan_merge_src, self._plan_merge_dst):
                 combo.clear()
                 combo.addItem("Shared", "*")
-                if self.ws.vcs:
-                    for b in self.ws.vcs.get_branches():
-                        combo.addItem(b['name'], b['name'])
+                combo.addItems(sig)
+                for i, name in enumerate(sig, 1):
+                    combo.setItemData(i, name)
 
         # Get filtered tasks
         scope = self._plan_scope.currentData()
-        tasks = proj.get_tasks(scope=scope)
-
-        # Sort: critical > high > medium > low, then by updated_at desc
-        prio_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        tasks.sort(key=lambda t: (prio_order.get(t.get("priority"), 9), -t.get("updated_at", 0)))
-
-        # Clear columns
-        for sid, col in self._plan_cols.items():
-            lay = col["layout"]
-            while lay.count() > 1:
-                item = lay.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
-        # Populate columns
-        counts = {"todo": 0, "progress": 0, "done": 0}
-        for t in tasks:
-            status = t.get("status", "todo")
-            if status not in self._plan_cols:
-                continue
-            card = self._make_task_card(t)
-            col = self._plan_cols[status]
-            col["layout"].insertWidget(col["layout"].count() - 1, card)
-            counts[status] = counts.get(status, 0) + 1
-
-        # Update counts
+        tasks = self._planner_tasks(scope)
+
+        # Nothing to do if the visible tasks are exactly what is on the board
+        # (update_task bumps updated_at, so any edit changes the signature)
+        sig = tuple((t["id"], t.get("status"), t.get("priority"), t.get("updated_at"))
+                    for t in tasks)
+        if sig == self._last_planner_sig:
+            if self._plan_scope.currentText() != self._plan_stats_scope:
+                self._update_plan_counts()
+            return
+        self._last_planner_sig = sig
+
+        # Sort: critical > high > medium > low, then by updated_at desc.
+        # Decorate-sort-undecorate into a new list: the unscoped result is the
+        # project's own task list, which must not be reordered in place.
+        keyed = [(_plan_sort_key(t), t) for t in tasks]
+        if len(keyed) > 1:
+            keyed.sort(key=operator.itemgetter(0))
+
+        # Bucket by column. The per-column key/id lists are kept so single-task
+        # edits (_place_task / _unplace_task) can bisect instead of re-sorting.
+        by_status = {sid: [] for sid in self._plan_cols}
+        for kv in keyed:
+            bucket = by_status.get(kv[1].get("status", "todo"))
+            if bucket is not None:
+                bucket.append(kv)
+        self._plan_keys = {sid: [kv[0] for kv in b] for sid, b in by_status.items()}
+        self._plan_order = {sid: [kv[1]["id"] for kv in b] for sid, b in by_status.items()}
+
+        # Diff cards against the previous refresh, keyed by task id: only
+        # vanished tasks are destroyed and only new ones are built.
+        # Only the first _plan_caps[column] tasks of each column get a card.
+        cards = self._card_widgets
+        caps = self._plan_caps
+        shown = {tid for sid, order in self._plan_order.items()
+                 for tid in order[:caps[sid]]}
+        for tid in [tid for tid in cards if tid not in shown]:
+            self._drop_task_card(tid)
+
+        # Populate columns, moving existing cards only when out of place
+        for status, bucket in by_status.items():
+            lay = self._plan_cols[status]["layout"]
+            for pos, (_, t) in enumerate(bucket[:caps[status]]):
+                entry = cards.get(t["id"])
+                if entry is None:
+                    entry = cards[t["id"]] = self._make_task_card(t)
+                else:
+                    self._update_task_card(entry, t)
+                card = entry["card"]
+                if entry["col"] != status or lay.indexOf(card) != pos:
+                    if entry["col"]:
+                        self._plan_cols[entry["col"]]["layout"].removeWidget(card)
+                    lay.insertWidget(pos, card)
+                    entry["col"] = status
+
+        self._update_plan_counts()
+
+    def _update_plan_counts(self):
+        """Column counts, overflow footers and the stats line."""
+        counts = {sid: len(order) for sid, order in self._plan_order.items()}
         for sid, col in self._plan_cols.items():
-            col["count_lbl"].setText(str(counts.get(sid, 0)))
+            # Always the real total, not just what is drawn
+            col["count_lbl"].setText(str(counts[sid]))
+            hidden = counts[sid] - self._plan_caps[sid]
+            if hidden > 0:
+                col["footer"].setText(f"Show {min(hidden, _PLAN_CARD_CAP)} more  ({hidden} hidden)")
+            col["footer"].setVisible(hidden > 0)
 
         # Stats
         total = sum(counts.values())
         done = counts.get("done", 0)
         pct = int(done / total * 100) if total > 0 else 0
-        scope_txt = self._plan_scope.currentText()
+        scope_txt = self._plan_stats_scope = self._plan_scope.currentText()
         self._plan_stats.setText(
             f"{total} tasks  ·  {pct}% complete  ·  Showing: {scope_txt}")
 
-    def _make_task_card(self, task: dict) -> QFrame:
+    def _show_more_tasks(self, status: str):
+        """Raise one column's card cap by a page and place the newly shown cards."""
+        self._plan_caps[status] += _PLAN_CARD_CAP
+        self._last_planner_sig = None  # force the diff pass; existing cards are reused
+        self._refresh_planner()
+
+    def _drop_task_card(self, task_id: str):
+        entry = self._card_widgets.pop(task_id)
+        self._plan_cols[entry["col"]]["layout"].removeWidget(entry["card"])
+        entry["card"].deleteLater()
+
+    def _place_task(self, task: dict, status: str):
+        """Insert a task into a column's sorted order without a full refresh.
+        It gets a card (reusing its existing one) only if it lands within the
+        cap; a card pushed past the cap is released."""
+        keys, order = self._plan_keys[status], self._plan_order[status]
+        key = _plan_sort_key(task)
+        pos = bisect.bisect_right(keys, key)
+        keys.insert(pos, key)
+        order.insert(pos, task["id"])
+
+        cap = self._plan_caps[status]
+        entry = self._card_widgets.get(task["id"])
+        if pos >= cap:
+            if entry is not None:
+                self._drop_task_card(task["id"])
+            return
+        if entry is None:
+            entry = self._card_widgets[task["id"]] = self._make_task_card(task)
+        else:
+            self._update_task_card(entry, task)
+        self._plan_cols[status]["layout"].insertWidget(pos, entry["card"])
+        entry["col"] = status
+        if len(order) > cap:
+            self._drop_task_card(order[cap])
+
+    def _unplace_task(self, task_id: str, status: str):
+        """Remove a task from a column's order (its card is left to the caller)
+        and give the task that slides up into view a card."""
+        keys, order = self._plan_keys[status], self._plan_order[status]
+        i = order.index(task_id)
+        del keys[i], order[i]
+        cap = self._plan_caps[status]
+        if i < cap <= len(order):
+            task = self._planner_task(order[cap - 1])
+            entry = self._card_widgets[task["id"]] = self._make_task_card(task)
+            self._plan_cols[status]["layout"].insertWidget(cap - 1, entry["card"])
+            entry["col"] = status
+
+    def _make_task_card(self, task: dict) -> dict:
+        """Build a task card; returns the card plus handles for in-place updates."""
         card = QFrame()
         card.setObjectName("task_card")
         cl = QVBoxLayout(card)
         cl.setContentsMargins(12, 10, 12, 10)
         cl.setSpacing(5)
 
-        # Top row: priority dot + title
-        top = QHBoxLayout()
-        top.setSpacing(8)
-        pcolor = self.PRIORITY_COLORS.get(task.get("priority", "medium"), C["fg_dim"])
-        dot = _label("●", pcolor, 10)
-        dot.setFixedWidth(14)
-        top.addWidget(dot)
-        title = _label(task["title"], C["fg"], 13, bold=True)
-        title.setWordWrap(True)
-        top.addWidget(title, 1)
-        cl.addLayout(top)
-
-        # Description (if any)
-        desc = task.get("description", "").strip()
-        if desc:
-            d = _label(desc[:120] + ("..." if len(desc) > 120 else ""),
-                        C["fg_dark"], 11)
-            d.setWordWrap(True)
-            cl.addWidget(d)
+        # Priority dot, title, description and meta share one rich-text label
+        body = _label("")
+        body.setTextFormat(Qt.RichText)
+        body.setWordWrap(True)
+        cl.addWidget(body)
+
+        # Action buttons row; the move buttons depend on status
+        btns = QHBoxLayout()
+        btns.setSpacing(4)
+        moves = QHBoxLayout()
+        moves.setSpacing(4)
+        btns.addLayout(moves)
+        btns.addStretch()
+
+        tid = task["id"]
+
+        # Edit / Delete
+        edit = _btn("Edit", "ghost")
+        edit.clicked.connect(lambda _, t=tid: self._planner_edit_task(t))
+        btns.addWidget(edit)
+
+        delete = _btn("×", "ghost")
+        delete.setFixedWidth(30)
+        delete.clicked.connect(lambda _, t=tid: self._planner_delete(t))
+        btns.addWidget(delete)
 
-        # Meta row: scope + tags + due
+        cl.addLayout(btns)
+        entry = {"card": card, "body": body, "moves": moves,
+                 "view": None, "col": None}
+        self._update_task_card(entry, task)
+        return entry
+
+    def _update_task_card(self, entry: dict, task: dict):
+        """Push a task's fields into its card, touching only what changed."""
+        prio = task.get("priority", "medium")
+        pcolor = self.PRIORITY_COLORS.get(prio) or C["fg_dim"]
+        desc = task.get("description", "").strip()
+        if len(desc) > 120:
+            desc = desc[:120] + "..."
         meta_parts = []
         scope = task.get("scope", "*")
-        scope_txt = "shared" if scope == "*" else scope
-        meta_parts.append(scope_txt)
+        meta_parts.append("shared" if scope == "*" else scope)
         if task.get("tags"):
             meta_parts.append(" ".join(f"#{t}" for t in task["tags"][:3]))
         if task.get("due_date"):
             meta_parts.append(f"due {task['due_date']}")
-        meta_parts.append(task.get("priority", "medium"))
-        meta = _label("  ·  ".join(meta_parts), C["fg_gutter"], 10)
-        cl.addWidget(meta)
-
-        # Action buttons row
-        btns = QHBoxLayout()
-        btns.setSpacing(4)
-
-        status = task.get("status", "todo")
-        tid = task["id"]
+        meta_parts.append(prio)
+        view = (pcolor, task["title"], desc, "  ·  ".join(meta_parts),
+                task.get("status", "todo"))
+
+        old = entry["view"] or (None,) * len(view)
+        if view[:4] != old[:4]:
+            # Top row: priority dot + title; then description (if any) and
+            # the meta row: scope + tags + due
+            parts = [
+                f"<span style='color:{pcolor}; font-size:10px'>●</span>&nbsp;&nbsp;"
+                f"<span style='color:{C['fg']}; font-size:13px; font-weight:600'>"
+                f"{html.escape(view[1])}</span>"]
+            if desc:
+                parts.append(f"<div style='color:{C['fg_dark']}; font-size:11px; "
+                             f"margin-top:5px'>{html.escape(desc)}</div>")
+            parts.append(f"<div style='color:{C['fg_gutter']}; font-size:10px; "
+                         f"margin-top:5px'>{html.escape(view[3])}</div>")
+            entry["body"].setText("".join(parts))
+        if view[4] != old[4]:
+            self._set_move_buttons(entry["moves"], task["id"], view[4])
+        entry["view"] = view
+
+    def _set_move_buttons(self, moves: QHBoxLayout, tid: str, status: str):
+        while moves.count():
+            item = moves.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
 
         # Move left/right buttons
         if status == "progress":
             b = _btn("← Todo", "ghost")
             b.clicked.connect(lambda _, t=tid: self._planner_move(t, "todo"))
-            btns.addWidget(b)
+            moves.addWidget(b)
             b = _btn("Done →", "ghost")
             b.clicked.connect(lambda _, t=tid: self._planner_move(t, "done"))
-            btns.addWidget(b)
+            moves.addWidget(b)
         elif status == "todo":
             b = _btn("Start →", "ghost")
             b.clicked.connect(lambda _, t=tid: self._planner_move(t, "progress"))
-            btns.addWidget(b)
+            moves.addWidget(b)
         elif status == "done":
             b = _btn("← Reopen", "ghost")
             b.clicked.connect(lambda _, t=tid: self._planner_move(t, "progress"))
-            btns.addWidget(b)
-
-        btns.addStretch()
-
-        # Edit / Delete
-        edit = _btn("Edit", "ghost")
-        edit.clicked.connect(lambda _, t=tid: self._planner_edit_task(t))
-        btns.addWidget(edit)
-
-        delete = _btn("×", "ghost")
-        delete.setFixedWidth(30)
-        delete.clicked.connect(lambda _, t=tid: self._planner_delete(t))
-        btns.addWidget(delete)
-
-        cl.addLayout(btns)
-        return card
+            moves.addWidget(b)
 
     def _planner_add_task(self):
         if not self.ws.has_active:
@@ -1968,7 +2294,7 @@ class QuelldexWindow(QMainWindow):
         # Priority dialog
         prio, ok = QInputDialog.getItem(
             self, "Priority", "Select priority:",
-            ["medium", "high", "critical", "low"], 0, False)
+            _PRIO_CHOICES, 0, False)
         if not ok:
             prio = "medium"
 
@@ -1978,14 +2304,32 @@ class QuelldexWindow(QMainWindow):
 
         self.ws.project.add_task(title, scope=scope, priority=prio,
                                   description=desc or "")
-        self._refresh_planner()
+        self._invalidate_task_cache()
+        self._schedule_planner_refresh()
         self.status.showMessage(f"Task added: {title}", 3000)
 
     def _planner_move(self, task_id: str, new_status: str):
         if not self.ws.has_active:
             return
-        self.ws.project.update_task(task_id, status=new_status)
-        self._refresh_planner()
+        task = self.ws.project.update_task(task_id, status=new_status)
+        # Status is not a scope filter and the task dict is updated in place,
+        # so the cached task lists stay valid
+        if not self._move_task_card(task, new_status):
+            self._schedule_planner_refresh()
+
+    def _move_task_card(self, task, new_status: str) -> bool:
+        """Carry a moved task's card to its new column in place; False means
+        a full refresh is needed instead."""
+        entry = self._card_widgets.get(task["id"]) if task else None
+        if (entry is None or self._planner_refresh_pending
+                or new_status not in self._plan_cols or entry["col"] == new_status):
+            return False
+        old_status = entry["col"]
+        self._plan_cols[old_status]["layout"].removeWidget(entry["card"])
+        self._unplace_task(task["id"], old_status)
+        self._place_task(task, new_status)
+        self._update_plan_counts()
+        return True
 
     def _planner_delete(self, task_id: str):
         if not self.ws.has_active:
@@ -1995,17 +2339,14 @@ class QuelldexWindow(QMainWindow):
                                   QMessageBox.Yes | QMessageBox.No)
         if r == QMessageBox.Yes:
             self.ws.project.delete_task(task_id)
-            self._refresh_planner()
+            self._invalidate_task_cache()
+            self._schedule_planner_refresh()
 
     def _planner_edit_task(self, task_id: str):
         if not self.ws.has_active:
             return
         proj = self.ws.project
-        task = None
-        for t in proj.get_tasks():
-            if t["id"] == task_id:
-                task = t
-                break
+        task = self._planner_task(task_id)
         if not task:
             return
 
@@ -2014,10 +2355,10 @@ class QuelldexWindow(QMainWindow):
             return
         desc, _ = QInputDialog.getText(self, "Edit Task", "Description:",
                                          text=task.get("description", ""))
+        cur_prio = task.get("priority", "medium")
         prio, _ = QInputDialog.getItem(
-            self, "Edit Task", "Priority:",
-            ["medium", "high", "critical", "low"],
-            ["medium", "high", "critical", "low"].index(task.get("priority", "medium")),
+            self, "Edit Task", "Priority:", _PRIO_CHOICES,
+            _PRIO_CHOICES.index(cur_prio) if cur_prio in _PRIO_CHOICES else 0,
             False)
 
         # Scope selection
@@ -2046,7 +2387,8 @@ class QuelldexWindow(QMainWindow):
 
         proj.update_task(task_id, title=title.strip(), description=desc or "",
                           priority=prio, scope=scope, due_date=due or "", tags=tags)
-        self._refresh_planner()
+        self._invalidate_task_cache()
+        self._schedule_planner_refresh()
         self.status.showMessage(f"Task updated: {title.strip()}", 3000)
 
     def _planner_merge(self):
@@ -2060,8 +2402,18 @@ class QuelldexWindow(QMainWindow):
             QMessageBox.information(self, "Merge", "Source and target are the same.")
             return
         merged = self.ws.project.merge_tasks_from_branch(src, dst)
-        self._refresh_planner()
-        self.status.showMessage(f"Merged {merged} tasks from {src} into {dst}", 3000)
+        self._invalidate_task_cache()
+        if self._planner_refresh_pending:
+            self._schedule_planner_refresh()
+        else:
+            # Only the merged tasks are new: slot them into the board directly
+            scope = self._plan_scope.currentData()
+            for t in merged:
+                status = t.get("status", "todo")
+                if status in self._plan_cols and (scope is None or t.get("scope") in (scope, "*")):
+                    self._place_task(t, status)
+            self._update_plan_counts()
+        self.status.showMessage(f"Merged {len(merged)} tasks from {src} into {dst}", 3000)
 
     # ============================================================
     #  SETTINGS VIEW
@@ -2095,6 +2447,23 @@ class QuelldexWindow(QMainWindow):
         theme_l.addStretch()
         il.addWidget(theme_grp)
 
+        il.addStretch()
+        scroll.setWidget(inner)
+        layout.addWidget(scroll, 1)
+
+        # The other sections probe installed IDEs, the VCS and every open
+        # project, so they are built after the page's first paint
+        self._settings_seq += 1
+        QTimer.singleShot(0, inner, partial(
+            self._build_settings_sections, il, self._settings_seq))
+
+    def _build_settings_sections(self, il: QVBoxLayout, seq: int):
+        if seq != self._settings_seq:
+            return  # page was rebuilt in the meantime
+
+        def add(grp):
+            il.insertWidget(il.count() - 1, grp)  # keep the trailing stretch last
+
         # IDE
         ide_grp = QGroupBox("  IDE Integration  ")
         ide_l = QVBoxLayout(ide_grp)
@@ -2115,7 +2484,7 @@ class QuelldexWindow(QMainWindow):
         save.clicked.connect(self._save_ide_path)
         row.addWidget(save)
         ide_l.addLayout(row)
-        il.addWidget(ide_grp)
+        add(ide_grp)
 
         # External tools
         tools_grp = QGroupBox("  External Tools  ")
@@ -2135,7 +2504,7 @@ class QuelldexWindow(QMainWindow):
         for t in self.tool_bridge.get_registered_tools():
             exts = ", ".join(t.get("supported_ext", []))
             tl.addWidget(_label(f"  {t['name']}  ->  {exts}", C["green"], 12))
-        il.addWidget(tools_grp)
+        add(tools_grp)
 
         # Project info
         if self.ws.has_active:
@@ -2151,30 +2520,34 @@ class QuelldexWindow(QMainWindow):
                 f"Tags: {vcs_stats.get('tags', 0)}\n"
                 f"VCS size: {format_size(vcs_stats.get('storage_bytes', 0))}",
                 C["fg_dark"], 12, mono=True))
-            il.addWidget(info_grp)
+            add(info_grp)
 
         # All open projects summary
         if len(self.ws.all_paths) > 1:
             ws_grp = QGroupBox("  Workspace Overview  ")
             ws_l = QVBoxLayout(ws_grp)
-            for path in self.ws.all_paths:
+
+            def ws_row(path):
                 name = self.ws.name_of(path)
                 s = self.ws.get_project_summary(path)
                 active_mark = "  *" if path == self.ws.active_path else "   "
-                ws_l.addWidget(_label(
+                return _label(
                     f"{active_mark} {name}  -  {s.get('files', 0)} files  |  "
-                    f"{format_size(s.get('size', 0))}", C["fg_dark"], 12, mono=True))
-            il.addWidget(ws_grp)
+                    f"{format_size(s.get('size', 0))}", C["fg_dark"], 12, mono=True)
+            self._add_capped_rows(ws_l, self.ws.all_paths, ws_row)
+            add(ws_grp)
 
         # Shelf
         if self.ws.has_active and self.ws.project.data.get("shelf"):
             shelf_grp = QGroupBox("  Shelf  ")
             sl = QVBoxLayout(shelf_grp)
-            for op in self.ws.project.data["shelf"]:
+
+            def shelf_row(op):
                 act = {"move": "Move", "copy": "Copy", "delete": "Delete"}.get(op["action"], "?")
                 txt = f"{act}: {op['source']}"
                 if op["dest"]: txt += f" -> {op['dest']}"
-                sl.addWidget(_label(txt, C["fg_dark"], 12))
+                return _label(txt, C["fg_dark"], 12)
+            self._add_capped_rows(sl, self.ws.project.data["shelf"], shelf_row)
             sr = QHBoxLayout()
             ex_btn = _btn("Execute Shelf", "accent")
             ex_btn.clicked.connect(self._execute_shelf)
@@ -2184,11 +2557,26 @@ class QuelldexWindow(QMainWindow):
             sr.addWidget(cl_btn)
             sr.addStretch()
             sl.addLayout(sr)
-            il.addWidget(shelf_grp)
+            add(shelf_grp)
+
+    def _add_capped_rows(self, lay: QVBoxLayout, items: list, make_row):
+        """Add one row widget per item: the first _SETTINGS_ROW_CAP right away,
+        the rest behind a "show more" button."""
+        for item in items[:_SETTINGS_ROW_CAP]:
+            lay.addWidget(make_row(item))
+        rest = items[_SETTINGS_ROW_CAP:]
+        if not rest:
+            return
+        more = _btn(f"Show {len(rest)} more", "ghost")
 
-        il.addStretch()
-        scroll.setWidget(inner)
-        layout.addWidget(scroll, 1)
+        def expand():
+            at = lay.indexOf(more)
+            lay.removeWidget(more)
+            more.deleteLater()
+            for i, item in enumerate(rest):
+                lay.insertWidget(at + i, make_row(item))
+        more.clicked.connect(expand)
+        lay.addWidget(more)
 
     def _browse_ide_path(self):
         p, _ = QFileDialog.getOpenFileName(self, "Select IDE executable")
@@ -2249,12 +2637,13 @@ class QuelldexWindow(QMainWindow):
 
     def _apply_theme(self, theme_id: str):
         """Apply new theme and refresh entire UI."""
+        if theme_id == get_current_theme():
+            return  # nothing to restyle; skip the full view rebuild
         set_theme(theme_id)
         # Clear icon cache (colors changed)
         IconFactory.clear_cache()
-        # Reload QSS
-        from src.ui.theme import QSS as NEW_QSS
-        QApplication.instance().setStyleSheet(NEW_QSS)
+        # Swap in the (cached) QSS
+        apply_qss(QApplication.instance())
         # Rebuild all views with new colors
         self._invalidate_all_views()
         self._switch_view(self._current_view or "settings")
@@ -5,28 +5,30 @@ Branch arrow PNGs generated at runtime for native Qt tree expansion
 """
 
 import time as _time
-import tempfile, os, struct, zlib
+import tempfile, os, re, struct, zlib
+from functools import lru_cache
+from string import Template
+from typing import NamedTuple
 
 # ---- Minimal PNG generator (no Qt dependency needed) ----
 
 _arrow_dir = None   # temp directory for arrow PNGs
+_ARROW_CACHE = {}   # fg_hex -> (closed_path, open_path, transparent_path)
 
 
-def _write_png(path: str, width: int, height: int, rows: list):
-    """Write a minimal RGBA PNG file from raw pixel rows.
-    Each row is a list of (r, g, b, a) tuples of length width."""
+def _write_png(path: str, width: int, height: int, pixels: bytes):
+    """Write a minimal RGBA PNG file from a flat pixel buffer
+    (width * height * 4 bytes, row-major)."""
     def _chunk(tag, data):
         c = tag + data
         return struct.pack(">I", len(data)) + c + struct.pack(">I", zlib.crc32(c) & 0xFFFFFFFF)
-    raw = b""
-    for row in rows:
-        raw += b"\x00"  # filter byte
-        for r, g, b, a in row:
-            raw += struct.pack("BBBB", r, g, b, a)
+    stride = width * 4
+    raw = b"".join(b"\x00" + pixels[y * stride:(y + 1) * stride]  # filter byte + row
+                   for y in range(height))
     ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)  # 8-bit RGBA
     out = b"\x89PNG\r\n\x1a\n"
     out += _chunk(b"IHDR", ihdr)
-    out += _chunk(b"IDAT", zlib.compress(raw))
+    out += _chunk(b"IDAT", zlib.compress(raw, 1))  # tiny images: speed over ratio
     out += _chunk(b"IEND", b"")
     with open(path, "wb") as f:
         f.write(out)
@@ -35,16 +37,18 @@ def _write_png(path: str, width: int, height: int, rows: list):
 def _generate_branch_arrows(fg_hex: str) -> tuple:
     """Generate ▸ (closed), ▾ (open), and 1x1 transparent PNGs.
     Returns (closed_path, open_path, transparent_path).
-    Arrows are drawn small in center of 24x24 canvas to avoid stretch-blur."""
+    Arrows are drawn small in center of 24x24 canvas to avoid stretch-blur.
+    Files live for the whole process, so each color is only written once."""
     global _arrow_dir
+    if fg_hex in _ARROW_CACHE:
+        return _ARROW_CACHE[fg_hex]
     if _arrow_dir is None:
         _arrow_dir = tempfile.mkdtemp(prefix="quelldex_arrows_")
 
     h = fg_hex.lstrip("#")
     cr, cg, cb = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
     S = 24
-    T = (0, 0, 0, 0)
-    F = (cr, cg, cb, 200)
+    F = bytes((cr, cg, cb, 200))
 
     def _line(grid, x0, y0, x1, y1):
         """Bresenham line — single pixel, no thickening."""
@@ -54,7 +58,8 @@ def _generate_branch_arrows(fg_hex: str) -> tuple:
         err = dx - dy
         while True:
             if 0 <= x0 < S and 0 <= y0 < S:
-                grid[y0][x0] = F
+                i = (y0 * S + x0) * 4
+                grid[i:i + 4] = F
             if x0 == x1 and y0 == y1:
                 break
             e2 = 2 * err
@@ -62,23 +67,26 @@ def _generate_branch_arrows(fg_hex: str) -> tuple:
             if e2 < dx: err += dx; y0 += sy
 
     # ▸ Right chevron (closed) — small, centered
-    closed = [[T] * S for _ in range(S)]
+    closed = bytearray(S * S * 4)
     #   from (9,7) -> (14,12) -> (9,17)
     _line(closed, 9, 7, 14, 12)
     _line(closed, 14, 12, 9, 17)
 
     # ▾ Down chevron (open) — small, centered
-    opened = [[T] * S for _ in range(S)]
+    opened = bytearray(S * S * 4)
     #   from (7,9) -> (12,14) -> (17,9)
     _line(opened, 7, 9, 12, 14)
     _line(opened, 12, 14, 17, 9)
 
-    cp = os.path.join(_arrow_dir, "closed.png")
-    op = os.path.join(_arrow_dir, "open.png")
+    # Colour in the file name: each theme's QSS keeps pointing at its own arrows
+    cp = os.path.join(_arrow_dir, f"closed_{h}.png")
+    op = os.path.join(_arrow_dir, f"open_{h}.png")
     tp = os.path.join(_arrow_dir, "transparent.png")
     _write_png(cp, S, S, closed)
     _write_png(op, S, S, opened)
-    _write_png(tp, 1, 1, [[(0, 0, 0, 0)]])
+    if not _ARROW_CACHE:  # colorless, so shared by every palette
+        _write_png(tp, 1, 1, bytes(4))
+    _ARROW_CACHE[fg_hex] = (cp, op, tp)
     return cp, op, tp
 
 
@@ -213,17 +221,68 @@ THEMES = {
     },
 }
 
+
+class ThemeColors(NamedTuple):
+    """A palette resolved into fixed fields. Building one from a THEMES
+    entry also checks that the palette defines every color."""
+    label: str
+    bg: str
+    bg_dark: str
+    bg_float: str
+    bg_highlight: str
+    bg_sidebar: str
+    bg_input: str
+    bg_hover: str
+    bg_selected: str
+    bg_card: str
+    bg_card_hover: str
+    fg: str
+    fg_dark: str
+    fg_dim: str
+    fg_gutter: str
+    fg_muted: str
+    border: str
+    border_focus: str
+    border_subtle: str
+    accent: str
+    accent_soft: str
+    accent_dim: str
+    accent2: str
+    green: str
+    red: str
+    orange: str
+    yellow: str
+    cyan: str
+    teal: str
+    magenta: str
+    blue: str
+    blue2: str
+    scrollbar: str
+    scrollbar_bg: str
+    diff_add_bg: str
+    diff_add_fg: str
+    diff_del_bg: str
+    diff_del_fg: str
+    diff_hdr_fg: str
+
+
+# Resolved once at load; the QSS generator reads attributes, not dict keys
+_THEME_COLORS = {name: ThemeColors(**pal) for name, pal in THEMES.items()}
+
 # ================================================================
 #  Active State (module-level, switchable at runtime)
 # ================================================================
 
 _current_theme = "dark"
 C = dict(THEMES["dark"])
+_QSS_BY_THEME = {}  # theme id -> generated stylesheet
+_last_applied_qss = None  # stylesheet last handed to apply_qss()
 
-PALETTE = [
+PALETTE = (
     "#6580c8", "#7fb86a", "#d96070", "#d0a050", "#9b82cc",
-    "#58aec0", "#d0a050", "#5cb898", "#cdd1dc", "#5faac8",
-]
+    "#58aec0", "#c87850", "#5cb898", "#cdd1dc", "#5faac8",
+)
+PALETTE_LEN = len(PALETTE)
 
 FONT_FAMILY = "Segoe UI, Inter, -apple-system, Microsoft YaHei, PingFang SC, Noto Sans CJK SC, sans-serif"
 MONO_FAMILY = "Cascadia Code, JetBrains Mono, Consolas, Menlo, monospace"
@@ -234,175 +293,192 @@ def get_current_theme() -> str:
 
 
 def set_theme(name: str):
-    """Switch active theme. Updates C dict, regenerates arrow PNGs, rebuilds QSS."""
+    """Switch active theme. Updates C dict and QSS (generated on first use)."""
     global _current_theme, C, QSS
-    if name not in THEMES:
-        return
+    if name not in THEMES or name == _current_theme:
+        return  # unknown, or already active: C and QSS are current
     _current_theme = name
     C.clear()
     C.update(THEMES[name])
-    # Generate branch arrow PNGs using current theme's fg_dim color
-    arrow_closed, arrow_open, arrow_trans = _generate_branch_arrows(C["fg_dim"])
-    QSS = _build_qss(C, arrow_closed, arrow_open, arrow_trans)
+    QSS = get_qss(name)
+
+
+def get_qss(name: str = None) -> str:
+    """Stylesheet for a theme (default: the active one), built once per theme."""
+    name = name or _current_theme
+    qss = _QSS_BY_THEME.get(name)
+    if qss is None:
+        c = _THEME_COLORS[name]
+        # Branch arrow PNGs use the theme's fg_dim color
+        arrow_closed, arrow_open, arrow_trans = _generate_branch_arrows(c.fg_dim)
+        qss = _QSS_BY_THEME[name] = _build_qss(c, arrow_closed, arrow_open, arrow_trans)
+    return qss
+
+
+def apply_qss(app):
+    """Set the active theme's stylesheet on the application, unless it is
+    already the one applied: setStyleSheet() re-polishes every widget."""
+    global _last_applied_qss
+    qss = get_qss()
+    if qss is _last_applied_qss:
+        return
+    _last_applied_qss = qss
+    app.setStyleSheet(qss)
 
 
-def get_theme_names() -> list:
-    return [(k, v["label"]) for k, v in THEMES.items()]
+@lru_cache(maxsize=1)
+def get_theme_names() -> tuple:
+    return tuple((k, v["label"]) for k, v in THEMES.items())
 
 
 # ================================================================
 #  QSS Generator
 # ================================================================
 
-def _build_qss(c: dict, arrow_closed: str = "", arrow_open: str = "", arrow_trans: str = "") -> str:
-    # Normalize paths for QSS url() — must use forward slashes
-    ac = arrow_closed.replace("\\", "/")
-    ao = arrow_open.replace("\\", "/")
-    at = arrow_trans.replace("\\", "/")
-    return f"""
+_QSS_SOURCE = """
 /* === Foundation === */
-* {{ margin: 0; padding: 0; }}
-QWidget {{
-    background-color: {c['bg']};
-    color: {c['fg']};
-    font-family: {FONT_FAMILY};
+* { margin: 0; padding: 0; }
+QWidget {
+    background-color: ${bg};
+    color: ${fg};
+    font-family: ${font};
     font-size: 13px;
     border: none;
     outline: none;
-}}
-QMainWindow {{ background-color: {c['bg']}; }}
+}
+QMainWindow { background-color: ${bg}; }
 
 /* === Sidebar === */
-QFrame#sidebar {{
-    background-color: {c['bg_sidebar']};
-    border-right: 1px solid {c['border_subtle']};
-}}
-QFrame#sidebar_divider {{
-    background-color: {c['border']};
+QFrame#sidebar {
+    background-color: ${bg_sidebar};
+    border-right: 1px solid ${border_subtle};
+}
+QFrame#sidebar_divider {
+    background-color: ${border};
     max-height: 1px;
     margin: 6px 20px;
-}}
+}
 
 /* === Cards / Panels === */
-QFrame#card, QFrame#float_panel {{
-    background-color: {c['bg_float']};
-    border: 1px solid {c['border']};
+QFrame#card, QFrame#float_panel {
+    background-color: ${bg_float};
+    border: 1px solid ${border};
     border-radius: 10px;
-}}
-QGroupBox {{
-    background-color: {c['bg_float']};
-    border: 1px solid {c['border']};
+}
+QGroupBox {
+    background-color: ${bg_float};
+    border: 1px solid ${border};
     border-radius: 10px;
     margin-top: 18px;
     padding: 22px 16px 16px 16px;
-    color: {c['fg_dim']};
+    color: ${fg_dim};
     font-size: 11px;
     font-weight: 600;
     letter-spacing: 0.3px;
-}}
-QGroupBox::title {{
+}
+QGroupBox::title {
     subcontrol-origin: margin;
     left: 16px;
     padding: 0 8px;
-    color: {c['fg_dim']};
-}}
-QLabel {{
+    color: ${fg_dim};
+}
+QLabel {
     background: transparent;
     border: none;
     padding: 0;
-    color: {c['fg']};
-}}
+    color: ${fg};
+}
 
 /* === Buttons === */
-QPushButton {{
-    background-color: {c['bg_highlight']};
-    color: {c['fg_dark']};
-    border: 1px solid {c['border']};
+QPushButton {
+    background-color: ${bg_highlight};
+    color: ${fg_dark};
+    border: 1px solid ${border};
     border-radius: 8px;
     padding: 8px 20px;
     font-size: 13px;
     font-weight: 500;
     min-height: 18px;
-}}
-QPushButton:hover {{
-    background-color: {c['bg_hover']};
-    color: {c['fg']};
-    border-color: {c['fg_gutter']};
-}}
-QPushButton:pressed {{ background-color: {c['bg_selected']}; }}
-QPushButton:disabled {{
-    color: {c['fg_gutter']};
-    background-color: {c['bg_dark']};
-}}
-QPushButton#accent {{
-    background-color: {c['accent']};
+}
+QPushButton:hover {
+    background-color: ${bg_hover};
+    color: ${fg};
+    border-color: ${fg_gutter};
+}
+QPushButton:pressed { background-color: ${bg_selected}; }
+QPushButton:disabled {
+    color: ${fg_gutter};
+    background-color: ${bg_dark};
+}
+QPushButton#accent {
+    background-color: ${accent};
     color: #f0f0f5;
     border: none;
     font-weight: 600;
     border-radius: 8px;
     padding: 8px 22px;
-}}
-QPushButton#accent:hover {{ background-color: {c['accent_dim']}; }}
-QPushButton#ghost {{
+}
+QPushButton#accent:hover { background-color: ${accent_dim}; }
+QPushButton#ghost {
     background: transparent;
-    color: {c['fg_dim']};
+    color: ${fg_dim};
     border: 1px solid transparent;
     padding: 7px 14px;
-}}
-QPushButton#ghost:hover {{
-    background-color: {c['bg_highlight']};
-    color: {c['fg']};
-}}
+}
+QPushButton#ghost:hover {
+    background-color: ${bg_highlight};
+    color: ${fg};
+}
 /* Planner — Kanban columns */
-QFrame#plan_col {{
-    background-color: {c['bg_dark']};
-    border: 1px solid {c['border']};
+QFrame#plan_col {
+    background-color: ${bg_dark};
+    border: 1px solid ${border};
     border-radius: 10px;
-}}
+}
 /* Planner — Task cards */
-QFrame#task_card {{
-    background-color: {c['bg_float']};
-    border: 1px solid {c['border']};
+QFrame#task_card {
+    background-color: ${bg_float};
+    border: 1px solid ${border};
     border-radius: 8px;
-}}
-QFrame#task_card:hover {{
-    border-color: {c['fg_gutter']};
-    background-color: {c['bg_hover']};
-}}
-QPushButton#icon_btn {{
+}
+QFrame#task_card:hover {
+    border-color: ${fg_gutter};
+    background-color: ${bg_hover};
+}
+QPushButton#icon_btn {
     background: transparent;
-    color: {c['fg_dim']};
+    color: ${fg_dim};
     border: 1px solid transparent;
     border-radius: 7px;
     padding: 3px;
     min-height: 0;
     min-width: 0;
-}}
-QPushButton#icon_btn:hover {{
-    background-color: {c['bg_hover']};
-    border-color: {c['border']};
-    color: {c['fg']};
-}}
-QPushButton#toolbar_btn {{
-    background-color: {c['bg_highlight']};
-    color: {c['fg_dim']};
-    border: 1px solid {c['border']};
+}
+QPushButton#icon_btn:hover {
+    background-color: ${bg_hover};
+    border-color: ${border};
+    color: ${fg};
+}
+QPushButton#toolbar_btn {
+    background-color: ${bg_highlight};
+    color: ${fg_dim};
+    border: 1px solid ${border};
     border-radius: 7px;
     padding: 6px 16px;
     font-size: 12px;
     font-weight: 500;
     min-height: 14px;
-}}
-QPushButton#toolbar_btn:hover {{
-    background-color: {c['bg_hover']};
-    color: {c['fg']};
-    border-color: {c['fg_gutter']};
-}}
+}
+QPushButton#toolbar_btn:hover {
+    background-color: ${bg_hover};
+    color: ${fg};
+    border-color: ${fg_gutter};
+}
 
 /* Sidebar nav */
-QPushButton#sidebar_btn {{
+QPushButton#sidebar_btn {
     background: transparent;
-    color: {c['fg_dim']};
+    color: ${fg_dim};
     border: none;
     border-radius: 8px;
     padding: 9px 18px;
@@ -410,329 +486,362 @@ QPushButton#sidebar_btn {{
     font-size: 13px;
     font-weight: 500;
     margin: 1px 12px;
-}}
-QPushButton#sidebar_btn:hover {{
-    background-color: {c['bg_highlight']};
-    color: {c['fg']};
-}}
-QPushButton#sidebar_active {{
-    background-color: {c['accent_soft']};
-    color: {c['fg']};
+}
+QPushButton#sidebar_btn:hover {
+    background-color: ${bg_highlight};
+    color: ${fg};
+}
+QPushButton#sidebar_active {
+    background-color: ${accent_soft};
+    color: ${fg};
     border: none;
-    border-left: 3px solid {c['accent']};
+    border-left: 3px solid ${accent};
     border-radius: 0 8px 8px 0;
     padding: 9px 18px 9px 15px;
     text-align: left;
     font-size: 13px;
     font-weight: 600;
     margin: 1px 12px 1px 0;
-}}
+}
 
 /* Project cards */
-QPushButton#proj_btn {{
-    background: {c['bg_card']};
-    color: {c['fg_dark']};
-    border: 1px solid {c['border']};
+QPushButton#proj_btn {
+    background: ${bg_card};
+    color: ${fg_dark};
+    border: 1px solid ${border};
     border-radius: 8px;
     padding: 8px 14px;
     text-align: left;
     font-size: 12px;
     margin: 2px 10px;
-}}
-QPushButton#proj_btn:hover {{
-    background-color: {c['bg_card_hover']};
-    color: {c['fg']};
-    border-color: {c['fg_gutter']};
-}}
-QPushButton#proj_active {{
-    background-color: {c['accent_soft']};
-    color: {c['fg']};
-    border: 1px solid {c['accent_dim']};
-    border-left: 3px solid {c['accent']};
+}
+QPushButton#proj_btn:hover {
+    background-color: ${bg_card_hover};
+    color: ${fg};
+    border-color: ${fg_gutter};
+}
+QPushButton#proj_active {
+    background-color: ${accent_soft};
+    color: ${fg};
+    border: 1px solid ${accent_dim};
+    border-left: 3px solid ${accent};
     border-radius: 0 8px 8px 0;
     padding: 8px 14px 8px 11px;
     text-align: left;
     font-size: 12px;
     font-weight: 600;
     margin: 2px 10px 2px 0;
-}}
+}
 
 /* === Input === */
-QLineEdit {{
-    background-color: {c['bg_input']};
-    color: {c['fg']};
-    border: 1px solid {c['border']};
+QLineEdit {
+    background-color: ${bg_input};
+    color: ${fg};
+    border: 1px solid ${border};
     border-radius: 8px;
     padding: 9px 14px;
     font-size: 13px;
-    selection-background-color: {c['bg_selected']};
-}}
-QLineEdit:focus {{ border-color: {c['border_focus']}; }}
-QLineEdit#search {{
-    background-color: {c['bg_highlight']};
+    selection-background-color: ${bg_selected};
+}
+QLineEdit:focus { border-color: ${border_focus}; }
+QLineEdit#search {
+    background-color: ${bg_highlight};
     border: 1px solid transparent;
     border-radius: 8px;
     padding: 9px 14px;
     font-size: 13px;
-}}
-QLineEdit#search:focus {{ border-color: {c['fg_gutter']}; }}
-QTextEdit, QPlainTextEdit {{
-    background-color: {c['bg_float']};
-    color: {c['fg']};
-    border: 1px solid {c['border']};
+}
+QLineEdit#search:focus { border-color: ${fg_gutter}; }
+QTextEdit, QPlainTextEdit {
+    background-color: ${bg_float};
+    color: ${fg};
+    border: 1px solid ${border};
     border-radius: 8px;
     padding: 12px;
-    font-family: {MONO_FAMILY};
+    font-family: ${mono};
     font-size: 12px;
-    selection-background-color: {c['bg_selected']};
-}}
-QComboBox {{
-    background-color: {c['bg_input']};
-    color: {c['fg']};
-    border: 1px solid {c['border']};
+    selection-background-color: ${bg_selected};
+}
+QComboBox {
+    background-color: ${bg_input};
+    color: ${fg};
+    border: 1px solid ${border};
     border-radius: 8px;
     padding: 8px 14px;
     min-width: 110px;
-}}
-QComboBox:hover {{ border-color: {c['fg_gutter']}; }}
-QComboBox::drop-down {{ border: none; width: 28px; }}
-QComboBox::down-arrow {{
+}
+QComboBox:hover { border-color: ${fg_gutter}; }
+QComboBox::drop-down { border: none; width: 28px; }
+QComboBox::down-arrow {
     border-left: 4px solid transparent;
     border-right: 4px solid transparent;
-    border-top: 5px solid {c['fg_dim']};
+    border-top: 5px solid ${fg_dim};
     margin-right: 10px;
-}}
-QComboBox QAbstractItemView {{
-    background-color: {c['bg_float']};
-    color: {c['fg']};
-    border: 1px solid {c['border']};
+}
+QComboBox QAbstractItemView {
+    background-color: ${bg_float};
+    color: ${fg};
+    border: 1px solid ${border};
     border-radius: 8px;
-    selection-background-color: {c['bg_selected']};
+    selection-background-color: ${bg_selected};
     outline: none;
     padding: 4px;
-}}
+}
 
 /* === Tree / List / Table === */
-QTreeWidget, QTreeView, QListView, QTableView {{
+QTreeWidget, QTreeView, QListView, QTableView {
     background-color: transparent;
     alternate-background-color: transparent;
-    color: {c['fg']};
+    color: ${fg};
     border: none;
     outline: none;
     font-size: 13px;
-}}
-QTreeWidget::item, QTreeView::item, QListView::item {{
+}
+QTreeWidget::item, QTreeView::item, QListView::item {
     padding: 5px 10px;
     border: none;
     border-radius: 6px;
     margin: 1px 4px;
     min-height: 22px;
-}}
-QTreeWidget::item:selected, QTreeView::item:selected {{
-    background-color: {c['accent_soft']};
-    color: {c['fg']};
-}}
-QTreeWidget::item:hover, QTreeView::item:hover {{
-    background-color: {c['bg_highlight']};
-}}
-QTreeWidget::branch {{
+}
+QTreeWidget::item:selected, QTreeView::item:selected {
+    background-color: ${accent_soft};
+    color: ${fg};
+}
+QTreeWidget::item:hover, QTreeView::item:hover {
+    background-color: ${bg_highlight};
+}
+QTreeWidget::branch {
     background: transparent;
     border: none;
-    border-image: url({at}) 0;
+    border-image: url(${arrow_trans}) 0;
     image: none;
     selection-background-color: transparent;
-}}
-QTreeWidget::branch:selected {{
+}
+QTreeWidget::branch:selected {
     background: transparent;
-    border-image: url({at}) 0;
-}}
-QTreeWidget::branch:has-siblings:!adjoins-item {{
-    border-image: url({at}) 0;
-    image: none;
-}}
-QTreeWidget::branch:has-siblings:adjoins-item {{
-    border-image: url({at}) 0;
-    image: none;
-}}
-QTreeWidget::branch:!has-children:!has-siblings:adjoins-item {{
-    border-image: url({at}) 0;
+    border-image: url(${arrow_trans}) 0;
+}
+/* Selected and plain branch states share bodies: specificity, not order,
+   decides between these selectors, and ::branch is already transparent */
+QTreeWidget::branch:has-siblings:!adjoins-item,
+QTreeWidget::branch:has-siblings:adjoins-item,
+QTreeWidget::branch:!has-children:!has-siblings:adjoins-item,
+QTreeWidget::branch:selected:has-siblings:!adjoins-item,
+QTreeWidget::branch:selected:has-siblings:adjoins-item,
+QTreeWidget::branch:selected:!has-children:!has-siblings:adjoins-item {
+    background: transparent;
+    border-image: url(${arrow_trans}) 0;
     image: none;
-}}
+}
 QTreeWidget::branch:has-children:!has-siblings:closed,
-QTreeWidget::branch:closed:has-children:has-siblings {{
-    border-image: url({at}) 0;
-    image: url({ac});
-    padding: 2px;
-}}
-QTreeWidget::branch:open:has-children:!has-siblings,
-QTreeWidget::branch:open:has-children:has-siblings {{
-    border-image: url({at}) 0;
-    image: url({ao});
-    padding: 2px;
-}}
+QTreeWidget::branch:closed:has-children:has-siblings,
 QTreeWidget::branch:selected:has-children:!has-siblings:closed,
-QTreeWidget::branch:selected:closed:has-children:has-siblings {{
+QTreeWidget::branch:selected:closed:has-children:has-siblings {
     background: transparent;
-    border-image: url({at}) 0;
-    image: url({ac});
+    border-image: url(${arrow_trans}) 0;
+    image: url(${arrow_closed});
     padding: 2px;
-}}
+}
+QTreeWidget::branch:open:has-children:!has-siblings,
+QTreeWidget::branch:open:has-children:has-siblings,
 QTreeWidget::branch:selected:open:has-children:!has-siblings,
-QTreeWidget::branch:selected:open:has-children:has-siblings {{
+QTreeWidget::branch:selected:open:has-children:has-siblings {
     background: transparent;
-    border-image: url({at}) 0;
-    image: url({ao});
+    border-image: url(${arrow_trans}) 0;
+    image: url(${arrow_open});
     padding: 2px;
-}}
-QTreeWidget::branch:selected:has-siblings:!adjoins-item,
-QTreeWidget::branch:selected:has-siblings:adjoins-item,
-QTreeWidget::branch:selected:!has-children:!has-siblings:adjoins-item {{
-    background: transparent;
-    border-image: url({at}) 0;
-    image: none;
-}}
-QHeaderView::section {{
-    background-color: {c['bg_highlight']};
-    color: {c['fg_dim']};
+}
+QHeaderView::section {
+    background-color: ${bg_highlight};
+    color: ${fg_dim};
     border: none;
-    border-right: 1px solid {c['border']};
-    border-bottom: 1px solid {c['border']};
+    border-right: 1px solid ${border};
+    border-bottom: 1px solid ${border};
     padding: 8px 14px;
     font-weight: 600;
     font-size: 11px;
     text-transform: uppercase;
     letter-spacing: 0.5px;
-}}
+}
 
 /* === Tabs === */
-QTabWidget::pane {{
-    background-color: {c['bg']};
-    border: 1px solid {c['border']};
+QTabWidget::pane {
+    background-color: ${bg};
+    border: 1px solid ${border};
     border-radius: 0 0 10px 10px;
     top: -1px;
-}}
-QTabBar::tab {{
+}
+QTabBar::tab {
     background-color: transparent;
-    color: {c['fg_dim']};
+    color: ${fg_dim};
     border: none;
     border-bottom: 2px solid transparent;
     padding: 10px 22px;
     margin-right: 4px;
     font-size: 12px;
     font-weight: 500;
-}}
-QTabBar::tab:selected {{
-    color: {c['accent']};
-    border-bottom: 2px solid {c['accent']};
-}}
-QTabBar::tab:hover:!selected {{
-    color: {c['fg']};
-    border-bottom: 2px solid {c['fg_gutter']};
-}}
+}
+QTabBar::tab:selected {
+    color: ${accent};
+    border-bottom: 2px solid ${accent};
+}
+QTabBar::tab:hover:!selected {
+    color: ${fg};
+    border-bottom: 2px solid ${fg_gutter};
+}
 
 /* === Scrollbar === */
-QScrollBar:vertical {{
+QScrollBar:vertical {
     background: transparent;
     width: 7px;
     margin: 4px 2px;
-}}
-QScrollBar::handle:vertical {{
-    background: {c['scrollbar']};
+}
+QScrollBar::handle:vertical {
+    background: ${scrollbar};
     border-radius: 3px;
     min-height: 40px;
-}}
-QScrollBar::handle:vertical:hover {{ background: {c['fg_dim']}; }}
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0; }}
-QScrollBar:horizontal {{
+}
+QScrollBar::handle:vertical:hover { background: ${fg_dim}; }
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
+QScrollBar:horizontal {
     background: transparent;
     height: 7px;
     margin: 2px 4px;
-}}
-QScrollBar::handle:horizontal {{
-    background: {c['scrollbar']};
+}
+QScrollBar::handle:horizontal {
+    background: ${scrollbar};
     border-radius: 3px;
     min-width: 40px;
-}}
-QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{ width: 0; }}
+}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
 
 /* === Splitter === */
-QSplitter::handle {{ background: transparent; }}
-QSplitter::handle:horizontal {{ width: 6px; }}
-QSplitter::handle:vertical {{ height: 6px; }}
-QSplitter::handle:hover {{ background-color: {c['border']}; border-radius: 2px; }}
+QSplitter::handle { background: transparent; }
+QSplitter::handle:horizontal { width: 6px; }
+QSplitter::handle:vertical { height: 6px; }
+QSplitter::handle:hover { background-color: ${border}; border-radius: 2px; }
 
 /* === Misc === */
-QToolTip {{
-    background-color: {c['bg_float']};
-    color: {c['fg']};
-    border: 1px solid {c['border']};
+QToolTip {
+    background-color: ${bg_float};
+    color: ${fg};
+    border: 1px solid ${border};
     border-radius: 6px;
     padding: 6px 12px;
     font-size: 12px;
-}}
-QRadioButton, QCheckBox {{ background: transparent; spacing: 8px; }}
-QRadioButton::indicator, QCheckBox::indicator {{
+}
+QRadioButton, QCheckBox { background: transparent; spacing: 8px; }
+QRadioButton::indicator, QCheckBox::indicator {
     width: 16px; height: 16px;
-    border: 2px solid {c['fg_gutter']};
-    background: {c['bg_input']};
+    border: 2px solid ${fg_gutter};
+    background: ${bg_input};
     border-radius: 4px;
-}}
-QRadioButton::indicator {{ border-radius: 9px; }}
-QRadioButton::indicator:checked, QCheckBox::indicator:checked {{
-    background-color: {c['accent']};
-    border-color: {c['accent']};
-}}
-QMenu {{
-    background-color: {c['bg_float']};
-    color: {c['fg']};
-    border: 1px solid {c['border']};
+}
+QRadioButton::indicator { border-radius: 9px; }
+QRadioButton::indicator:checked, QCheckBox::indicator:checked {
+    background-color: ${accent};
+    border-color: ${accent};
+}
+QMenu {
+    background-color: ${bg_float};
+    color: ${fg};
+    border: 1px solid ${border};
     border-radius: 10px;
     padding: 6px;
-}}
-QMenu::item {{
+}
+QMenu::item {
     padding: 8px 28px 8px 14px;
     border-radius: 6px;
     font-size: 13px;
-}}
-QMenu::item:selected {{ background-color: {c['accent_soft']}; }}
-QMenu::separator {{ height: 1px; background: {c['border']}; margin: 4px 12px; }}
-QStatusBar {{
-    background-color: {c['bg_dark']};
-    color: {c['fg_dim']};
-    border-top: 1px solid {c['border_subtle']};
+}
+QMenu::item:selected { background-color: ${accent_soft}; }
+QMenu::separator { height: 1px; background: ${border}; margin: 4px 12px; }
+QStatusBar {
+    background-color: ${bg_dark};
+    color: ${fg_dim};
+    border-top: 1px solid ${border_subtle};
     font-size: 12px;
     padding: 3px 14px;
-}}
-QScrollArea {{ border: none; background: transparent; }}
+}
+QScrollArea { border: none; background: transparent; }
 """
 
 
+def _split_qss(text: str) -> tuple:
+    """Cut the QSS source into consecutive runs of rules: runs without
+    placeholders stay plain strings, the rest become Templates. Order is
+    kept, since later QSS rules win specificity ties."""
+    runs = []
+    for rule in re.findall(r"[^{}]*\{(?:\$\{\w+\}|[^{}])*\}|[^{}]+\Z", text):
+        dynamic = "$" in rule
+        if runs and runs[-1][0] == dynamic:
+            runs[-1][1].append(rule)
+        else:
+            runs.append((dynamic, [rule]))
+    return tuple(Template("".join(r)) if dynamic else "".join(r)
+                 for dynamic, r in runs)
+
+
+# Parsed once; only the color-dependent runs are substituted per theme
+_QSS_PARTS = _split_qss(_QSS_SOURCE)
+
+
+def _build_qss(c: ThemeColors, arrow_closed: str = "", arrow_open: str = "", arrow_trans: str = "") -> str:
+    # Normalize paths for QSS url() — must use forward slashes
+    mapping = dict(
+        c._asdict(), font=FONT_FAMILY, mono=MONO_FAMILY,
+        arrow_closed=arrow_closed.replace("\\", "/"),
+        arrow_open=arrow_open.replace("\\", "/"),
+        arrow_trans=arrow_trans.replace("\\", "/"))
+    return "".join(p if isinstance(p, str) else p.substitute(mapping)
+                   for p in _QSS_PARTS)
+
+
 # Build initial QSS
-_initial_closed, _initial_open, _initial_trans = _generate_branch_arrows(C["fg_dim"])
-QSS = _build_qss(C, _initial_closed, _initial_open, _initial_trans)
+QSS = get_qss()
 
 
 # ================================================================
 #  Utility Formatters
 # ================================================================
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+# Bound once: the formatters run per row when lists are populated
+_now, _strftime, _localtime = _time.time, _time.strftime, _time.localtime
+_TS_MAX = 32503680000  # 3000-01-01, the ceiling of localtime() on Windows
+
 def format_size(n: int) -> str:
-    for u in ("B", "KB", "MB", "GB"):
-        if n < 1024:
-            return f"{n:.1f} {u}" if u != "B" else f"{n} B"
-        n /= 1024
-    return f"{n:.1f} TB"
+    if n < 1024:
+        return f"{n} B"
+    # Unit from the bit length (each unit is 10 bits), capped at TB
+    i = min((int(n).bit_length() - 1) // 10, 4)
+    return f"{n / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
+@lru_cache(maxsize=4096)  # listings repeat mtimes (bulk copies, checkouts)
 def format_time(ts: float) -> str:
+    # NaN fails the comparison and far-future stamps stay out of localtime();
+    # None and pre-epoch stamps on Windows raise, once per value thanks to the cache
     try:
-        return _time.strftime("%Y-%m-%d %H:%M", _time.localtime(ts))
-    except Exception:
-        return "-"
+        if ts <= _TS_MAX:
+            return _strftime("%Y-%m-%d %H:%M", _localtime(ts))
+    except (TypeError, ValueError, OverflowError, OSError):
+        pass
+    return "-"
+
+@lru_cache(maxsize=4096)
+def _format_age(m: int) -> str:
+    """Relative label for an age in whole minutes (under a week)."""
+    if m < 1: return "just now"
+    if m < 60: return f"{m}m ago"
+    if m < 1440: return f"{m // 60}h ago"
+    return f"{m // 1440}d ago"
 
 def format_time_relative(ts: float) -> str:
-    d = _time.time() - ts
-    if d < 60: return "just now"
-    if d < 3600: return f"{int(d // 60)}m ago"
-    if d < 86400: return f"{int(d // 3600)}h ago"
-    if d < 604800: return f"{int(d // 86400)}d ago"
+    # Every label below a week depends only on the age in minutes
+    try:
+        m = int((_now() - ts) // 60)
+    except (TypeError, ValueError, OverflowError):
+        return "-"  # None, NaN, inf
+    if m < 10080: return _format_age(m)
     return format_time(ts)
@@ -3,11 +3,54 @@ Quelldex Widgets v4 — Polished custom PySide6 widgets
 ChartWidget (QPainter) · Tag chips · Stat cards · Folder indicators
 """
 
-from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout, QSizePolicy
-from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QPainter, QPen, QColor, QFont, QBrush, QPainterPath, QLinearGradient
+from functools import lru_cache
 
-from src.ui.theme import C, PALETTE, MONO_FAMILY
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QSizePolicy
+from PySide6.QtCore import Qt, QEvent, QRectF, QPointF, QLineF, QSize
+from PySide6.QtGui import (
+    QPainter, QPen, QColor, QFont, QFontMetrics, QBrush, QPainterPath, QPolygonF, QGradient, QLinearGradient, QPixmap,
+    QImage, QIcon, QRadialGradient, QGuiApplication,
+)
+
+from src.ui.theme import C, PALETTE, PALETTE_LEN, MONO_FAMILY
+
+
+_HEATMAP_INK = QColor("#14161b")  # label color on saturated heatmap cells
+
+
+def _heatmap_color(v: float) -> QColor:
+    """Diverging blue-white-red fill for a correlation in [-1, 1]."""
+    if v >= 0:
+        cr = 255; cg = int(255 * (1 - v)); cb = cg
+    else:
+        cr = int(255 * (1 + v)); cg = cr; cb = 255
+    return QColor(cr, cg, cb)
+
+
+def _bar_brush(top: QColor, bottom: QColor) -> QBrush:
+    """Vertical gradient brush that spans whatever shape it fills."""
+    grad = QLinearGradient(0, 0, 0, 1)
+    grad.setCoordinateMode(QGradient.ObjectBoundingMode)
+    grad.setColorAt(0.0, top)
+    grad.setColorAt(1.0, bottom)
+    return QBrush(grad)
+
+
+_THIN_BAR = 3.0  # px; at or below this a bar's rounded corners are not visible
+
+# Fill colors quantised to 1/64 steps (about 4 of 255 levels per step)
+_HEATMAP_STEPS = 64
+_HEATMAP_LUT = tuple(_heatmap_color(k / _HEATMAP_STEPS)
+                     for k in range(-_HEATMAP_STEPS, _HEATMAP_STEPS + 1))
+
+
+def _heatmap_cells(matrix: list) -> list:
+    """(row, col, LUT index, label, dark ink?) for every matrix cell.
+    Depends only on the data, so ChartWidget computes it once per chart."""
+    steps = _HEATMAP_STEPS
+    return [(i, j, min(max(round(v * steps), -steps), steps) + steps,
+             f"{v:.2f}", abs(v) > 0.3)
+            for i, row in enumerate(matrix) for j, v in enumerate(row)]
 
 
 class ChartWidget(QWidget):
@@ -17,34 +60,85 @@ class ChartWidget(QWidget):
         super().__init__(parent)
         self.setMinimumSize(300, 250)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # paintEvent covers every pixel (corners included), so Qt need not
+        # paint whatever lies underneath first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self._chart_data = None
         self._chart_type = None
         self._title = ""
         self._margin = {"top": 48, "right": 32, "bottom": 52, "left": 76}
+        # Paint resources, built once (views are rebuilt on theme change)
+        self._pen_border = QPen(QColor(C["border"]), 1)
+        self._brush_bg = QBrush(QColor(C["bg_float"]))
+        # Behind the rounded corners: the ${bg} the stylesheet gives the view around us
+        self._corner_bg = QColor(C["bg"])
+        self._pen_grid = QPen(QColor(C["bg_highlight"]))
+        self._pen_grid.setStyle(Qt.DotLine)
+        self._pen_axis = QPen(QColor(C["fg_gutter"]), 1)
+        self._fg = QColor(C["fg"])
+        self._fg_dim = QColor(C["fg_dim"])
+        self._fg_dark = QColor(C["fg_dark"])
+        self._accent_soft = QColor(C["accent_soft"])
+        self._palette_qcolors = tuple(QColor(c) for c in PALETTE)
+        # Top-to-bottom bar fills in bounding-box coordinates, so one
+        # brush serves every bar regardless of its height
+        self._hist_brush = _bar_brush(self._palette_qcolors[0], self._accent_soft)
+        self._bar_brushes = tuple(_bar_brush(c, QColor(c.red(), c.green(), c.blue(), 120))
+                                  for c in self._palette_qcolors)
+        self._title_font = None  # derived from the (polished) widget font
+        self._cache_pm = None    # last rendered chart, blitted on plain repaints
+        self._cache_key = None
+        self._heat_cells = None  # per-cell heatmap colors/labels for _chart_data
 
     def set_chart(self, chart_type: str, data: dict, title: str = ""):
         self._chart_type = chart_type
         self._chart_data = data
         self._title = title
+        self._cache_pm = None
+        self._heat_cells = None
         self.update()
 
     def clear(self):
         self._chart_data = None
         self._chart_type = None
         self._title = ""
+        self._cache_pm = None
         self.update()
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._title_font = None
+            self._cache_pm = None
+        super().changeEvent(event)
+
     def paintEvent(self, event):
+        # Expose/move/tooltip repaints just blit the last rendering; the
+        # chart itself is redrawn only after set_chart() or a resize
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self._cache_pm is None or self._cache_key != key:
+            pm = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(self._corner_bg)  # opaque, so the blit alone covers the widget
+            cp = QPainter(pm)
+            cp.setFont(self.font())  # a pixmap painter starts with the app font
+            self._render(cp)
+            cp.end()
+            self._cache_pm, self._cache_key = pm, key
         p = QPainter(self)
+        p.drawPixmap(0, 0, self._cache_pm)
+        p.end()
+
+    def _render(self, p: QPainter):
         p.setRenderHint(QPainter.Antialiasing)
         # Rounded background with subtle border
-        p.setPen(QPen(QColor(C["border"]), 1))
-        p.setBrush(QColor(C["bg_float"]))
+        p.setPen(self._pen_border)
+        p.setBrush(self._brush_bg)
         p.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 10, 10)
 
         if not self._chart_data or not self._chart_type:
             self._draw_empty(p)
-            p.end()
             return
 
         fn = {
@@ -60,7 +154,6 @@ class ChartWidget(QWidget):
             fn(p, self._chart_data)
         else:
             self._draw_empty(p)
-        p.end()
 
     def _plot_rect(self) -> QRectF:
         m = self._margin
@@ -70,36 +163,46 @@ class ChartWidget(QWidget):
 
     def _draw_title(self, p: QPainter):
         if self._title:
-            p.setPen(QColor(C["fg_dark"]))
-            f = p.font()
-            f.setPointSize(10)
-            f.setWeight(QFont.DemiBold)
-            p.setFont(f)
+            if self._title_font is None:
+                f = QFont(self.font())
+                f.setPointSize(10)
+                f.setWeight(QFont.DemiBold)
+                self._title_font = f
+            p.setPen(self._fg_dark)
+            p.setFont(self._title_font)
             p.drawText(QRectF(0, 6, self.width(), 34),
                        Qt.AlignHCenter | Qt.AlignVCenter, self._title)
 
     def _draw_grid(self, p: QPainter, r: QRectF, y_vals: list, fmt: str = ".1f"):
-        pen = QPen(QColor(C["bg_highlight"]))
-        pen.setStyle(Qt.DotLine)
-        p.setPen(pen)
-        p.setFont(_small_font())
         n = len(y_vals)
-        for i, v in enumerate(y_vals):
-            y = r.bottom() - (i / max(n - 1, 1)) * r.height()
-            p.drawLine(QPointF(r.left(), y), QPointF(r.right(), y))
-            p.setPen(QColor(C["fg_dim"]))
+        step = r.height() / max(n - 1, 1)
+        ys = [r.bottom() - i * step for i in range(n)]
+        # Lines first, then labels: two pen changes in total
+        p.setPen(self._pen_grid)
+        p.drawLines([QLineF(r.left(), y, r.right(), y) for y in ys])
+        p.setPen(self._fg_dim)
+        p.setFont(_small_font())
+        for y, v in zip(ys, y_vals):
             p.drawText(QRectF(0, y - 10, r.left() - 8, 20),
                        Qt.AlignRight | Qt.AlignVCenter, f"{v:{fmt}}")
-            p.setPen(pen)
+
+    def _fill_bars(self, p: QPainter, bars: list, radius: float):
+        """Fill (rect, brush) bars. Bars too thin for the corner radius to
+        show skip the rounded path and are filled as plain rects."""
+        p.setPen(Qt.NoPen)
+        for rect, brush in bars:
+            if min(rect.width(), rect.height()) <= _THIN_BAR:
+                p.fillRect(rect, brush)
+            else:
+                p.setBrush(brush)
+                p.drawRoundedRect(rect, radius, radius)
 
     def _draw_axes(self, p: QPainter, r: QRectF):
-        pen = QPen(QColor(C["fg_gutter"]))
-        pen.setWidth(1)
-        p.setPen(pen)
+        p.setPen(self._pen_axis)
         p.drawLine(QPointF(r.left(), r.bottom()), QPointF(r.right(), r.bottom()))
 
     def _draw_empty(self, p: QPainter):
-        p.setPen(QColor(C["fg_dim"]))
+        p.setPen(self._fg_dim)
         f = p.font()
         f.setPointSize(11)
         p.setFont(f)
@@ -119,17 +222,11 @@ class ChartWidget(QWidget):
         bw = r.width() / n
         self._draw_grid(p, r, [max_c * i / 4 for i in range(5)], ".0f")
         # Gradient bars
-        for i, c in enumerate(counts):
-            h = (c / max_c) * r.height()
-            rect = QRectF(r.left() + i * bw + 2, r.bottom() - h, bw - 4, h)
-            grad = QLinearGradient(rect.topLeft(), rect.bottomLeft())
-            grad.setColorAt(0.0, QColor(PALETTE[0]))
-            grad.setColorAt(1.0, QColor(C["accent_soft"]))
-            p.setPen(Qt.NoPen)
-            p.setBrush(QBrush(grad))
-            p.drawRoundedRect(rect, 3, 3)
+        brush = self._hist_brush
+        self._fill_bars(p, [(QRectF(r.left() + i * bw + 2, r.bottom() - h, bw - 4, h), brush)
+                            for i, h in enumerate(c / max_c * r.height() for c in counts)], 3)
         p.setFont(_small_font())
-        p.setPen(QColor(C["fg_dim"]))
+        p.setPen(self._fg_dim)
         step = max(1, n // 6)
         for i in range(0, n, step):
             x = r.left() + (i + 0.5) * bw
@@ -150,19 +247,13 @@ class ChartWidget(QWidget):
         n = len(values)
         bw = r.width() / n
         self._draw_grid(p, r, [max_v * i / 4 for i in range(5)], ".0f")
+        bars = []
         for i, v in enumerate(values):
             h = (v / max_v) * r.height()
-            rect = QRectF(r.left() + i * bw + 4, r.bottom() - h, bw - 8, h)
-            grad = QLinearGradient(rect.topLeft(), rect.bottomLeft())
-            color = QColor(PALETTE[i % len(PALETTE)])
-            grad.setColorAt(0.0, color)
-            color_dark = QColor(color)
-            color_dark.setAlpha(120)
-            grad.setColorAt(1.0, color_dark)
-            p.setPen(Qt.NoPen)
-            p.setBrush(QBrush(grad))
-            p.drawRoundedRect(rect, 4, 4)
-        p.setPen(QColor(C["fg_dim"]))
+            bars.append((QRectF(r.left() + i * bw + 4, r.bottom() - h, bw - 8, h),
+                         self._bar_brushes[i % PALETTE_LEN]))
+        self._fill_bars(p, bars, 4)
+        p.setPen(self._fg_dim)
         p.setFont(_small_font())
         for i, lbl in enumerate(labels):
             x = r.left() + (i + 0.5) * bw
@@ -183,21 +274,20 @@ class ChartWidget(QWidget):
         n = len(values)
         self._draw_grid(p, r, [vmin + (vmax - vmin) * i / 4 for i in range(5)])
         # Area fill
-        path = QPainterPath()
-        points = []
-        for i, v in enumerate(values):
-            x = r.left() + (i / max(n - 1, 1)) * r.width()
-            y = r.bottom() - ((v - vmin) / (vmax - vmin)) * r.height()
-            points.append(QPointF(x, y))
+        x0, y0 = r.left(), r.bottom()
+        sx, sy = r.width() / max(n - 1, 1), r.height() / (vmax - vmin)
+        points = [QPointF(x0 + i * sx, y0 - (v - vmin) * sy)
+                  for i, v in enumerate(values)]
+        # Paths are built from whole polygons: one call, not one per point
+        line = QPainterPath()
+        line.addPolygon(QPolygonF(points))
         # Fill area under curve
         area = QPainterPath()
-        area.moveTo(points[0].x(), r.bottom())
-        for pt in points:
-            area.lineTo(pt)
-        area.lineTo(points[-1].x(), r.bottom())
+        area.addPolygon(QPolygonF([QPointF(points[0].x(), y0), *points,
+                                   QPointF(points[-1].x(), y0)]))
         area.closeSubpath()
         grad = QLinearGradient(0, r.top(), 0, r.bottom())
-        c = QColor(PALETTE[0])
+        c = QColor(self._palette_qcolors[0])
         c.setAlpha(40)
         grad.setColorAt(0.0, c)
         c.setAlpha(5)
@@ -206,11 +296,7 @@ class ChartWidget(QWidget):
         p.setBrush(QBrush(grad))
         p.drawPath(area)
         # Line
-        line = QPainterPath()
-        line.moveTo(points[0])
-        for pt in points[1:]:
-            line.lineTo(pt)
-        pen = QPen(QColor(PALETTE[0]))
+        pen = QPen(self._palette_qcolors[0])
         pen.setWidth(2)
         p.setPen(pen)
         p.setBrush(Qt.NoBrush)
@@ -231,17 +317,17 @@ class ChartWidget(QWidget):
         vmin, vmax = min(all_v), max(all_v)
         if vmin == vmax: vmax = vmin + 1
         self._draw_grid(p, r, [vmin + (vmax - vmin) * i / 4 for i in range(5)])
+        x0, y0 = r.left(), r.bottom()
+        sy = r.height() / (vmax - vmin)
         for si, (name, vals) in enumerate(series.items()):
             clean = [v for v in vals if v is not None]
             if len(clean) < 2: continue
-            color = QColor(PALETTE[si % len(PALETTE)])
+            color = self._palette_qcolors[si % PALETTE_LEN]
             pen = QPen(color); pen.setWidth(2); p.setPen(pen)
             path = QPainterPath()
-            n = len(clean)
-            for i, v in enumerate(clean):
-                x = r.left() + (i / max(n - 1, 1)) * r.width()
-                y = r.bottom() - ((v - vmin) / (vmax - vmin)) * r.height()
-                path.moveTo(x, y) if i == 0 else path.lineTo(x, y)
+            sx = r.width() / max(len(clean) - 1, 1)
+            path.addPolygon(QPolygonF([QPointF(x0 + i * sx, y0 - (v - vmin) * sy)
+                                       for i, v in enumerate(clean)]))
             p.drawPath(path)
             ly = r.top() + 4 + si * 18
             p.drawLine(QPointF(r.right() - 100, ly), QPointF(r.right() - 80, ly))
@@ -261,20 +347,23 @@ class ChartWidget(QWidget):
         if xmin == xmax: xmax = xmin + 1
         if ymin == ymax: ymax = ymin + 1
         self._draw_grid(p, r, [ymin + (ymax - ymin) * i / 4 for i in range(5)])
-        color = QColor(PALETTE[2])
-        for px, py in points:
-            sx = r.left() + ((px - xmin) / (xmax - xmin)) * r.width()
-            sy = r.bottom() - ((py - ymin) / (ymax - ymin)) * r.height()
-            # Glow
-            glow = QColor(color)
-            glow.setAlpha(40)
-            p.setPen(Qt.NoPen)
-            p.setBrush(QBrush(glow))
-            p.drawEllipse(QPointF(sx, sy), 7, 7)
-            # Dot
-            color.setAlpha(200)
-            p.setBrush(QBrush(color))
-            p.drawEllipse(QPointF(sx, sy), 4, 4)
+        sx, sy = r.width() / (xmax - xmin), r.height() / (ymax - ymin)
+        centers = [QPointF(r.left() + (px - xmin) * sx, r.bottom() - (py - ymin) * sy)
+                   for px, py in points]
+        # Glows, then dots: one brush per pass instead of two per point.
+        # Ellipses are kept separate (not one path) so overlaps still
+        # accumulate alpha and dense regions read darker.
+        glow = QColor(self._palette_qcolors[2])
+        glow.setAlpha(40)
+        dot = QColor(glow)
+        dot.setAlpha(200)
+        p.setPen(Qt.NoPen)
+        p.setBrush(glow)
+        for c in centers:
+            p.drawEllipse(c, 7, 7)
+        p.setBrush(dot)
+        for c in centers:
+            p.drawEllipse(c, 4, 4)
         self._draw_axes(p, r)
 
     # -- Heatmap --------------------------------------------------
@@ -288,22 +377,26 @@ class ChartWidget(QWidget):
         m = 80
         cell = min((self.width() - m * 2) / n, (self.height() - m * 2) / n, 50)
         ox, oy = m, m
-        p.setFont(_small_font())
-        for i in range(n):
-            for j in range(n):
-                v = matrix[i][j]
-                if v >= 0:
-                    cr = 255; cg = int(255 * (1 - v)); cb = cg
-                else:
-                    cr = int(255 * (1 + v)); cg = cr; cb = 255
-                rect = QRectF(ox + j * cell, oy + i * cell, cell, cell)
-                p.setPen(Qt.NoPen)
-                p.setBrush(QColor(min(cr, 255), min(cg, 255), min(cb, 255)))
+        if self._heat_cells is None:
+            self._heat_cells = _heatmap_cells(matrix)
+        # Group cells by color step and label ink, so the brush and pen
+        # change once per group instead of once per cell
+        fills, inked, plain = {}, [], []
+        for i, j, k, text, ink in self._heat_cells:
+            rect = QRectF(ox + j * cell, oy + i * cell, cell, cell)
+            fills.setdefault(k, []).append(rect)
+            (inked if ink else plain).append((rect, text))
+        p.setPen(Qt.NoPen)
+        for k, rects in fills.items():
+            p.setBrush(_HEATMAP_LUT[k])
+            for rect in rects:
                 p.drawRoundedRect(rect, 3, 3)
-                tc = QColor("#14161b") if abs(v) > 0.3 else QColor(C["fg"])
-                p.setPen(tc)
-                p.drawText(rect, Qt.AlignCenter, f"{v:.2f}")
-        p.setPen(QColor(C["fg_dim"]))
+        p.setFont(_small_font())
+        for tc, cells in ((_HEATMAP_INK, inked), (self._fg, plain)):
+            p.setPen(tc)
+            for rect, text in cells:
+                p.drawText(rect, Qt.AlignCenter, text)
+        p.setPen(self._fg_dim)
         for i, c in enumerate(cols):
             lbl = c[:7] + "..." if len(c) > 7 else c
             p.save()
@@ -318,39 +411,96 @@ class ChartWidget(QWidget):
 # -- Tag Chip ----------------------------------------------------
 
 class TagChip(QWidget):
+    """Rounded label pill, painted directly (no layout or child QLabel)."""
+
     def __init__(self, text: str, color: str = PALETTE[0], parent=None):
         super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 4, 10, 4)
-        label = QLabel(text)
-        label.setStyleSheet(
-            f"color: {color}; font-size: 11px; font-weight: 600; background: transparent;")
-        layout.addWidget(label)
-        self.setStyleSheet(
-            f"background-color: {C['bg_highlight']}; border: 1px solid {C['border']}; border-radius: 12px;")
+        self._text = text
+        self._color = QColor(color)
         self.setFixedHeight(26)
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self._update_font()
+
+    def _update_font(self):
+        f = QFont(self.font())
+        f.setPixelSize(11)
+        f.setWeight(QFont.DemiBold)
+        self._font = f
+        self._text_w = QFontMetrics(f).horizontalAdvance(self._text)
+        self.updateGeometry()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._update_font()
+        super().changeEvent(event)
+
+    def sizeHint(self) -> QSize:
+        return QSize(self._text_w + 20, 26)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(QPen(QColor(C["border"]), 1))
+        p.setBrush(QColor(C["bg_highlight"]))
+        p.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+        p.setFont(self._font)
+        p.setPen(self._color)
+        p.drawText(self.rect(), Qt.AlignCenter, self._text)
+        p.end()
 
 
 # -- Stat Card ---------------------------------------------------
 
 class StatCard(QWidget):
+    """Value over caption in a rounded card, painted directly."""
+
     def __init__(self, value: str, label: str, color: str = C["accent"], parent=None):
         super().__init__(parent)
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 12, 16, 12)
-        layout.setSpacing(2)
-        vl = QLabel(value)
-        vl.setStyleSheet(
-            f"color: {color}; font-size: 20px; font-weight: bold; background: transparent;")
-        vl.setAlignment(Qt.AlignCenter)
-        layout.addWidget(vl)
-        dl = QLabel(label)
-        dl.setStyleSheet(
-            f"color: {C['fg_dim']}; font-size: 11px; background: transparent;")
-        dl.setAlignment(Qt.AlignCenter)
-        layout.addWidget(dl)
-        self.setStyleSheet(
-            f"background-color: {C['bg_float']}; border: 1px solid {C['border']}; border-radius: 10px;")
+        self._value = value
+        self._label = label
+        self._color = QColor(color)
+        self._update_fonts()
+
+    def _update_fonts(self):
+        vf = QFont(self.font())
+        vf.setPixelSize(20)
+        vf.setWeight(QFont.Bold)
+        lf = QFont(self.font())
+        lf.setPixelSize(11)
+        self._value_font, self._label_font = vf, lf
+        vm, lm = QFontMetrics(vf), QFontMetrics(lf)
+        self._value_h, self._label_h = vm.height(), lm.height()
+        self._text_w = max(vm.horizontalAdvance(self._value), lm.horizontalAdvance(self._label))
+        self.updateGeometry()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._update_fonts()
+        super().changeEvent(event)
+
+    def sizeHint(self) -> QSize:
+        # 16/12 px margins, 2 px between value and caption
+        return QSize(self._text_w + 32, self._value_h + self._label_h + 26)
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(QPen(QColor(C["border"]), 1))
+        p.setBrush(QColor(C["bg_float"]))
+        p.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+        # Value and caption stay centered as a block if the card is stretched
+        top = (self.height() - self._value_h - self._label_h - 2) / 2
+        p.setFont(self._value_font)
+        p.setPen(self._color)
+        p.drawText(QRectF(0, top, self.width(), self._value_h), Qt.AlignCenter, self._value)
+        p.setFont(self._label_font)
+        p.setPen(QColor(C["fg_dim"]))
+        p.drawText(QRectF(0, top + self._value_h + 2, self.width(), self._label_h),
+                   Qt.AlignCenter, self._label)
+        p.end()
 
 
 # -- Folder Arrow Indicator Widget --------------------------------
@@ -381,7 +531,9 @@ class FolderArrow(QWidget):
         p.end()
 
 
+@lru_cache(maxsize=1)
 def _small_font() -> QFont:
+    """Shared 8pt label font; built on first paint (needs a QApplication)."""
     f = QFont()
     f.setPointSize(8)
     return f
@@ -389,24 +541,40 @@ def _small_font() -> QFont:
 
 # -- Icon Factory — cached circular icons for tree items ----------
 
-from PySide6.QtGui import QPixmap, QIcon, QRadialGradient
-
 class IconFactory:
     """Generates and caches small circular QIcons for file tree.
     All icons are 18x18 with antialiased QPainter rendering.
     """
 
     _cache: dict = {}  # class-level cache shared across instances
+    _CACHE_MAX = 256   # oldest icons are evicted beyond this
     SIZE = 18
 
+    @staticmethod
+    def _pixmap(size: int) -> QPixmap:
+        """Transparent canvas at device resolution; painters draw on it in
+        logical (size x size) coordinates."""
+        screen = QGuiApplication.primaryScreen()
+        dpr = screen.devicePixelRatio() if screen else 1.0
+        pm = QPixmap(round(size * dpr), round(size * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(QColor(0, 0, 0, 0))
+        return pm
+
+    @classmethod
+    def _store(cls, key: str, pm: QPixmap) -> QIcon:
+        if len(cls._cache) >= cls._CACHE_MAX:
+            del cls._cache[next(iter(cls._cache))]
+        icon = cls._cache[key] = QIcon(pm)
+        return icon
+
     @classmethod
     def category_icon(cls, color: str) -> QIcon:
         """Filled circle with subtle gradient — for category group headers."""
         key = f"cat:{color}"
         if key not in cls._cache:
             s = cls.SIZE
-            pm = QPixmap(s, s)
-            pm.fill(QColor(0, 0, 0, 0))
+            pm = cls._pixmap(s)
             p = QPainter(pm)
             p.setRenderHint(QPainter.Antialiasing)
             c = QColor(color)
@@ -420,7 +588,7 @@ class IconFactory:
             p.setBrush(QBrush(grad))
             p.drawEllipse(2, 2, s - 4, s - 4)
             p.end()
-            cls._cache[key] = QIcon(pm)
+            return cls._store(key, pm)
         return cls._cache[key]
 
     @classmethod
@@ -429,8 +597,7 @@ class IconFactory:
         key = f"folder:{'open' if expanded else 'closed'}"
         if key not in cls._cache:
             s = cls.SIZE
-            pm = QPixmap(s, s)
-            pm.fill(QColor(0, 0, 0, 0))
+            pm = cls._pixmap(s)
             p = QPainter(pm)
             p.setRenderHint(QPainter.Antialiasing)
             fg = QColor(C["fg_dim"])
@@ -451,7 +618,7 @@ class IconFactory:
                 path.lineTo(6, 14)
                 p.drawPath(path)
             p.end()
-            cls._cache[key] = QIcon(pm)
+            return cls._store(key, pm)
         return cls._cache[key]
 
     @classmethod
@@ -459,33 +626,61 @@ class IconFactory:
         """Small filled dot with ring — for individual files."""
         key = f"file:{color}"
         if key not in cls._cache:
-            s = cls.SIZE
-            pm = QPixmap(s, s)
-            pm.fill(QColor(0, 0, 0, 0))
+            pm = cls._pixmap(cls.SIZE)
             p = QPainter(pm)
             p.setRenderHint(QPainter.Antialiasing)
-            c = QColor(color)
-            # Outer ring
-            ring = QColor(c)
-            ring.setAlpha(60)
-            p.setPen(Qt.NoPen)
-            p.setBrush(QBrush(ring))
-            p.drawEllipse(3, 3, s - 6, s - 6)
-            # Inner filled dot
-            p.setBrush(QBrush(c))
-            p.drawEllipse(5, 5, s - 10, s - 10)
+            cls._paint_file_dot(p, color)
             p.end()
-            cls._cache[key] = QIcon(pm)
+            return cls._store(key, pm)
         return cls._cache[key]
 
+    @classmethod
+    def _paint_file_dot(cls, p: QPainter, color: str):
+        s = cls.SIZE
+        c = QColor(color)
+        # Outer ring
+        ring = QColor(c)
+        ring.setAlpha(60)
+        p.setPen(Qt.NoPen)
+        p.setBrush(QBrush(ring))
+        p.drawEllipse(3, 3, s - 6, s - 6)
+        # Inner filled dot
+        p.setBrush(QBrush(c))
+        p.drawEllipse(5, 5, s - 10, s - 10)
+
+    @classmethod
+    def warm_file_icons(cls, colors):
+        """Pre-render file icons for many colors with a single painter.
+        Uncached colors are drawn side by side on one strip image, which
+        is then cut into per-color icons (used before populating a tree)."""
+        todo = [c for c in dict.fromkeys(colors) if f"file:{c}" not in cls._cache]
+        if not todo:
+            return
+        tile = cls._pixmap(cls.SIZE)  # for the device size and ratio
+        w, dpr = tile.width(), tile.devicePixelRatio()
+        strip = QImage(w * len(todo), tile.height(), QImage.Format_ARGB32_Premultiplied)
+        strip.setDevicePixelRatio(dpr)
+        strip.fill(Qt.transparent)
+        p = QPainter(strip)
+        p.setRenderHint(QPainter.Antialiasing)
+        for i, color in enumerate(todo):
+            p.save()
+            p.translate(i * w / dpr, 0)
+            cls._paint_file_dot(p, color)
+            p.restore()
+        p.end()
+        for i, color in enumerate(todo):
+            pm = QPixmap.fromImage(strip.copy(i * w, 0, w, tile.height()))
+            pm.setDevicePixelRatio(dpr)
+            cls._store(f"file:{color}", pm)
+
     @classmethod
     def loading_icon(cls) -> QIcon:
         """Dim pulsing dot for loading state."""
         key = "loading"
         if key not in cls._cache:
             s = cls.SIZE
-            pm = QPixmap(s, s)
-            pm.fill(QColor(0, 0, 0, 0))
+            pm = cls._pixmap(s)
             p = QPainter(pm)
             p.setRenderHint(QPainter.Antialiasing)
             c = QColor(C["fg_dim"])
@@ -494,7 +689,7 @@ class IconFactory:
             p.setBrush(QBrush(c))
             p.drawEllipse(4, 4, s - 8, s - 8)
             p.end()
-            cls._cache[key] = QIcon(pm)
+            return cls._store(key, pm)
         return cls._cache[key]
 
     @classmethod
@@ -507,8 +702,7 @@ class IconFactory:
         Names: 'collapse_all', 'expand_all', 'refresh'"""
         key = f"tb:{name}:{size}"
         if key not in cls._cache:
-            pm = QPixmap(size, size)
-            pm.fill(QColor(0, 0, 0, 0))
+            pm = cls._pixmap(size)
             p = QPainter(pm)
             p.setRenderHint(QPainter.Antialiasing)
 
@@ -538,7 +732,7 @@ class IconFactory:
                 p.drawLine(int(s*0.72), int(s*0.1), int(s*0.72), int(s*0.25))
 
             p.end()
-            cls._cache[key] = QIcon(pm)
+            return cls._store(key, pm)
         return cls._cache[key]
 
 
@@ -546,7 +740,7 @@ class IconFactory:
 #  Loading Spinner — animated ring indicator
 # ================================================================
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QTimer, QDateTime
 
 class LoadingSpinner(QWidget):
     """Smooth animated loading ring. Call start()/stop() to control."""
@@ -568,8 +762,10 @@ class LoadingSpinner(QWidget):
         self._label_text = label
         self._active = True
         self._angle = 0
-        self._timer.start()
         self.show()
+        # Off screen (e.g. a hidden parent page) showEvent starts it later
+        if self.isVisible():
+            self._timer.start()
 
     def stop(self):
         self._active = False
@@ -580,8 +776,20 @@ class LoadingSpinner(QWidget):
         self._angle = (self._angle + 4) % 360
         self.update()
 
+    # The timer only runs while the spinner is on screen
+    def showEvent(self, event):
+        if self._active:
+            # Resume where the clock says the ring would be (4 deg / 16 ms)
+            self._angle = (QDateTime.currentMSecsSinceEpoch() // 4) % 360
+            self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
     def paintEvent(self, event):
-        if not self._active:
+        if not self._active or self.visibleRegion().isEmpty():
             return
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
@@ -617,8 +825,79 @@ class LoadingSpinner(QWidget):
 #  Diff Viewer — side-by-side or unified diff display
 # ================================================================
 
-from PySide6.QtWidgets import QTextEdit, QSplitter, QFrame
-from PySide6.QtGui import QTextCharFormat
+import difflib
+
+from PySide6.QtWidgets import QPlainTextEdit, QSplitter, QFrame
+from PySide6.QtCore import QThread, Signal
+from PySide6.QtGui import QTextCharFormat, QTextCursor
+
+
+def _diff_rows(left_lines: list, right_lines: list) -> tuple:
+    """Align two line lists for side-by-side display.
+    Returns (left_doc, right_doc, n_add, n_del, n_mod); docs are lists of
+    (tag, line) rows with tag in equal/add/del/pad."""
+    sm = difflib.SequenceMatcher(None, left_lines, right_lines)
+    left_doc = []
+    right_doc = []
+    n_add = 0
+    n_del = 0
+    n_mod = 0
+
+    for tag, i1, i2, j1, j2 in sm.get_opcodes():
+        if tag == "equal":
+            for line in left_lines[i1:i2]:
+                left_doc.append(("equal", line))
+                right_doc.append(("equal", line))
+        elif tag == "replace":
+            n_mod += max(i2 - i1, j2 - j1)
+            max_len = max(i2 - i1, j2 - j1)
+            for k in range(max_len):
+                if i1 + k < i2:
+                    left_doc.append(("del", left_lines[i1 + k]))
+                else:
+                    left_doc.append(("pad", ""))
+                if j1 + k < j2:
+                    right_doc.append(("add", right_lines[j1 + k]))
+                else:
+                    right_doc.append(("pad", ""))
+        elif tag == "delete":
+            n_del += i2 - i1
+            for line in left_lines[i1:i2]:
+                left_doc.append(("del", line))
+                right_doc.append(("pad", ""))
+        elif tag == "insert":
+            n_add += j2 - j1
+            for line in right_lines[j1:j2]:
+                left_doc.append(("pad", ""))
+                right_doc.append(("add", line))
+    return left_doc, right_doc, n_add, n_del, n_mod
+
+
+class _DiffWorker(QThread):
+    """Runs _diff_rows() in a background thread.
+    Unparented, so deleting the viewer cannot destroy a running thread;
+    _DIFF_WORKERS holds the reference until it finishes."""
+    done = Signal(int, object)  # (seq, _diff_rows() result)
+
+    def __init__(self, seq: int, left_lines: list, right_lines: list):
+        super().__init__()
+        self._seq = seq
+        self._left = left_lines
+        self._right = right_lines
+        self.finished.connect(self._release)
+
+    def run(self):
+        self.done.emit(self._seq, _diff_rows(self._left, self._right))
+
+    def _release(self):
+        self.wait()
+        _DIFF_WORKERS.discard(self)
+
+
+_DIFF_WORKERS = set()
+_DIFF_PREFIX = {"equal": "  ", "add": "+ ", "del": "- ", "pad": "  "}
+_DIFF_CHUNK = 2000  # diff rows rendered per event-loop turn
+
 
 class DiffViewer(QWidget):
     """Side-by-side file comparison widget with syntax-highlighted diffs."""
@@ -645,6 +924,13 @@ class DiffViewer(QWidget):
         splitter.setSizes([500, 500])
         layout.addWidget(splitter, 1)
 
+        # Sync scrolling; _syncing stops the mirrored change echoing back
+        self._syncing = False
+        left_sb = self._left.verticalScrollBar()
+        right_sb = self._right.verticalScrollBar()
+        left_sb.valueChanged.connect(lambda v: self._sync_scroll(right_sb, v))
+        right_sb.valueChanged.connect(lambda v: self._sync_scroll(left_sb, v))
+
         # Stats bar
         self._stats = QLabel()
         self._stats.setStyleSheet(
@@ -652,77 +938,78 @@ class DiffViewer(QWidget):
             f"padding:6px 14px;font-size:11px;")
         layout.addWidget(self._stats)
 
-    def _make_text_pane(self) -> QTextEdit:
-        te = QTextEdit()
+        # Diffs are computed off the GUI thread; stale results are dropped
+        self._diff_seq = 0
+        self._line_counts = (0, 0)
+        self._spinner = LoadingSpinner(size=24, thickness=3, parent=self)
+        self._spinner.hide()
+
+    def _make_text_pane(self) -> QPlainTextEdit:
+        te = QPlainTextEdit()
         te.setReadOnly(True)
+        te.setUndoRedoEnabled(False)  # panes are rewritten wholesale, never undone
         te.setFont(QFont(MONO_FAMILY.split(",")[0].strip(), 11))
         te.setStyleSheet(
             f"background:{C['bg_float']};color:{C['fg']};"
             f"border:none;padding:8px;")
-        te.setLineWrapMode(QTextEdit.NoWrap)
+        te.setLineWrapMode(QPlainTextEdit.NoWrap)
         return te
 
     def set_diff(self, left_lines: list, right_lines: list,
                  left_label: str = "Original", right_label: str = "Modified"):
-        """Show side-by-side diff of two line lists."""
-        import difflib
+        """Show side-by-side diff of two line lists. The diff is computed
+        in a background thread; the panes update when it is ready."""
         self._header.setText(f"  {left_label}    vs    {right_label}")
-
-        sm = difflib.SequenceMatcher(None, left_lines, right_lines)
-        left_doc = []
-        right_doc = []
-        n_add = 0
-        n_del = 0
-        n_mod = 0
-
-        for tag, i1, i2, j1, j2 in sm.get_opcodes():
-            if tag == "equal":
-                for line in left_lines[i1:i2]:
-                    left_doc.append(("equal", line))
-                    right_doc.append(("equal", line))
-            elif tag == "replace":
-                n_mod += max(i2 - i1, j2 - j1)
-                max_len = max(i2 - i1, j2 - j1)
-                for k in range(max_len):
-                    if i1 + k < i2:
-                        left_doc.append(("del", left_lines[i1 + k]))
-                    else:
-                        left_doc.append(("pad", ""))
-                    if j1 + k < j2:
-                        right_doc.append(("add", right_lines[j1 + k]))
-                    else:
-                        right_doc.append(("pad", ""))
-            elif tag == "delete":
-                n_del += i2 - i1
-                for line in left_lines[i1:i2]:
-                    left_doc.append(("del", line))
-                    right_doc.append(("pad", ""))
-            elif tag == "insert":
-                n_add += j2 - j1
-                for line in right_lines[j1:j2]:
-                    left_doc.append(("pad", ""))
-                    right_doc.append(("add", line))
-
-        self._render_pane(self._left, left_doc)
-        self._render_pane(self._right, right_doc)
-
+        self._diff_seq += 1
+        self._line_counts = (len(left_lines), len(right_lines))
+        worker = _DiffWorker(self._diff_seq, left_lines, right_lines)
+        worker.done.connect(self._on_diff_ready)
+        _DIFF_WORKERS.add(worker)
+        worker.start()
+        self._spinner.start("Diffing...")
+        self._spinner.move(self.width() // 2 - 60, self.height() // 2 - 20)
+        self._spinner.raise_()
+
+    def _on_diff_ready(self, seq: int, result: tuple):
+        if seq != self._diff_seq:
+            return  # superseded by a later set_diff() or clear()
+        self._spinner.stop()
+        left_doc, right_doc, n_add, n_del, n_mod = result
+        self._render_rows(seq, left_doc, right_doc, 0)
+
+        n_left, n_right = self._line_counts
         self._stats.setText(
             f"  +{n_add} added    -{n_del} deleted    ~{n_mod} modified    "
-            f"{len(left_lines)} / {len(right_lines)} lines")
-
-        # Sync scrolling
-        self._left.verticalScrollBar().valueChanged.connect(
-            self._right.verticalScrollBar().setValue)
-        self._right.verticalScrollBar().valueChanged.connect(
-            self._left.verticalScrollBar().setValue)
-
-    def _render_pane(self, pane: QTextEdit, doc: list):
-        pane.clear()
-        cursor = pane.textCursor()
-
-        fmt_normal = QTextCharFormat()
-        fmt_normal.setForeground(QColor(C["fg"]))
-
+            f"{n_left} / {n_right} lines")
+
+    def _render_rows(self, seq: int, left_doc: list, right_doc: list, start: int):
+        """Render rows start..start+_DIFF_CHUNK into both panes, then queue
+        the next chunk, so a huge diff shows its top at once and fills in
+        without blocking the event loop."""
+        if seq != self._diff_seq:
+            return  # a newer diff (or clear) took over the panes
+        end = start + _DIFF_CHUNK
+        self._syncing = True  # both panes reset to the top themselves
+        try:
+            self._render_pane(self._left, left_doc[start:end], start)
+            self._render_pane(self._right, right_doc[start:end], start)
+        finally:
+            self._syncing = False
+        if end < len(left_doc):
+            QTimer.singleShot(0, self, lambda: self._render_rows(seq, left_doc, right_doc, end))
+
+    def _sync_scroll(self, target, value: int):
+        if self._syncing:
+            return
+        self._syncing = True
+        try:
+            target.setValue(value)
+        finally:
+            self._syncing = False
+
+    def _render_pane(self, pane: QPlainTextEdit, doc: list, start: int = 0):
+        """Show doc rows in pane; with start > 0 they are appended after
+        the first start rows already there."""
         fmt_add = QTextCharFormat()
         fmt_add.setBackground(QColor(C["diff_add_bg"]))
         fmt_add.setForeground(QColor(C["diff_add_fg"]))
@@ -731,26 +1018,42 @@ class DiffViewer(QWidget):
         fmt_del.setBackground(QColor(C["diff_del_bg"]))
         fmt_del.setForeground(QColor(C["diff_del_fg"]))
 
-        fmt_pad = QTextCharFormat()
-        fmt_pad.setForeground(QColor(C["fg_gutter"]))
+        fmt_map = {"add": fmt_add, "del": fmt_del}
 
-        fmt_map = {"equal": fmt_normal, "add": fmt_add,
-                   "del": fmt_del, "pad": fmt_pad}
+        # Set the whole text at once, then color runs of consecutive
+        # added/deleted lines. Equal lines already use the pane color and
+        # pad lines are blank, so neither needs a format.
+        runs = []  # [tag, first_line, last_line]
+        for i, (tag, _) in enumerate(doc, start):
+            if tag in fmt_map:
+                if runs and runs[-1][0] == tag and runs[-1][2] == i - 1:
+                    runs[-1][2] = i
+                else:
+                    runs.append([tag, i, i])
+        text = "\n".join(f"{_DIFF_PREFIX.get(tag, '  ')}{line}" for tag, line in doc)
+        text_doc = pane.document()
+        cursor = QTextCursor(text_doc)
+        if start:
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText("\n" + text, QTextCharFormat())  # plain, not the last run's format
+        else:
+            pane.setPlainText(text)
 
-        for i, (tag, line) in enumerate(doc):
-            prefix = {
-                "equal": "  ", "add": "+ ", "del": "- ", "pad": "  "
-            }.get(tag, "  ")
-            fmt = fmt_map.get(tag, fmt_normal)
-            cursor.setCharFormat(fmt)
-            text = f"{prefix}{line}"
-            if i > 0:
-                cursor.insertText("\n")
-            cursor.insertText(text)
+        # Positions come from the blocks (UTF-16 offsets), not len()
+        cursor.beginEditBlock()  # one relayout for all runs
+        for tag, first, last in runs:
+            end = text_doc.findBlockByNumber(last)
+            cursor.setPosition(text_doc.findBlockByNumber(first).position())
+            cursor.setPosition(end.position() + end.length() - 1, QTextCursor.KeepAnchor)
+            cursor.setCharFormat(fmt_map[tag])
+        cursor.endEditBlock()
 
-        pane.verticalScrollBar().setValue(0)
+        if not start:
+            pane.verticalScrollBar().setValue(0)
 
     def clear(self):
+        self._diff_seq += 1
+        self._spinner.stop()
         self._left.clear()
         self._right.clear()
         self._header.setText("")
@@ -5,30 +5,44 @@ Pure logic — no UI dependencies
 
 import csv
 import json
-import statistics
+import math
+import re
+from array import array
+from collections import Counter
+from operator import itemgetter, mul
 from pathlib import Path
 
+_NAN = float('nan')
+# Same strings float() accepts (bar digit underscores), without raising on the misses
+_NUMBER_RE = re.compile(r'\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)\s*',
+                        re.IGNORECASE)
+
 
 # ── Data Loading ────────────────────────────────────────────────
 
-def load_csv(filepath: str, encoding: str = 'utf-8') -> dict:
+def load_csv(filepath: str, encoding: str = 'utf-8', delimiter: str = None) -> dict:
+    """Load a delimited file; the delimiter is sniffed from the first 4 KB unless given."""
     path = Path(filepath)
     result = {"name": path.name, "path": str(path), "columns": [], "rows": [], "dtypes": {}}
     for enc in [encoding, 'utf-8-sig', 'gbk', 'gb2312', 'latin-1']:
         try:
             with open(path, 'r', encoding=enc, newline='') as f:
-                sample = f.read(4096)
-                f.seek(0)
-                try:
-                    dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
-                except csv.Error:
-                    dialect = csv.excel
-                reader = csv.reader(f, dialect)
-                rows = list(reader)
-                if not rows:
+                if delimiter:
+                    reader = csv.reader(f, delimiter=delimiter)
+                else:
+                    sample = f.read(4096)
+                    f.seek(0)
+                    try:
+                        dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
+                    except csv.Error:
+                        dialect = csv.excel
+                    reader = csv.reader(f, dialect)
+                # Header first, then the body straight into its list — no rows[1:] copy
+                header = next(reader, None)
+                if header is None:
                     return result
-                result["columns"] = [c.strip() for c in rows[0]]
-                result["rows"] = rows[1:]
+                result["columns"] = [c.strip() for c in header]
+                result["rows"] = list(reader)
                 result["dtypes"] = _detect_types(result["columns"], result["rows"])
                 return result
         except (UnicodeDecodeError, UnicodeError):
@@ -37,21 +51,7 @@ def load_csv(filepath: str, encoding: str = 'utf-8') -> dict:
 
 
 def load_tsv(filepath: str) -> dict:
-    path = Path(filepath)
-    result = {"name": path.name, "path": str(path), "columns": [], "rows": [], "dtypes": {}}
-    for enc in ['utf-8', 'utf-8-sig', 'gbk', 'latin-1']:
-        try:
-            with open(path, 'r', encoding=enc) as f:
-                reader = csv.reader(f, delimiter='\t')
-                rows = list(reader)
-                if rows:
-                    result["columns"] = [c.strip() for c in rows[0]]
-                    result["rows"] = rows[1:]
-                    result["dtypes"] = _detect_types(result["columns"], result["rows"])
-                return result
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-    return result
+    return load_csv(filepath, delimiter='\t')
 
 
 def load_json_data(filepath: str) -> dict:
@@ -71,10 +71,19 @@ def load_json_data(filepath: str) -> dict:
 
 def load_data_file(filepath: str) -> dict:
     ext = Path(filepath).suffix.lower()
-    if ext == '.csv':   return load_csv(filepath)
-    if ext == '.tsv':   return load_tsv(filepath)
-    if ext == '.json':  return load_json_data(filepath)
-    return {"name": Path(filepath).name, "path": filepath, "columns": [], "rows": [], "dtypes": {}}
+    if ext == '.csv':    ds = load_csv(filepath)
+    elif ext == '.tsv':  ds = load_tsv(filepath)
+    elif ext == '.json': ds = load_json_data(filepath)
+    else: ds = {"name": Path(filepath).name, "path": filepath, "columns": [], "rows": [], "dtypes": {}}
+    # Numeric columns parsed once into float arrays; chart/stat code reads these instead of the rows
+    ds["arrays"] = _build_arrays(ds["columns"], ds["rows"], ds["dtypes"])
+    ds["col_index"] = _index_columns(ds["columns"])
+    # Per-dataset memo slots — a reload returns a fresh dict, which invalidates them
+    ds["_stats_cache"] = {}
+    ds["_corr_cache"] = None
+    ds["_numeric_cache"] = {}
+    ds["_counts_cache"] = {}
+    return ds
 
 
 def _detect_types(columns, rows) -> dict:
@@ -84,93 +93,201 @@ def _detect_types(columns, rows) -> dict:
         for row in rows[:200]:
             if i < len(row) and row[i].strip():
                 total += 1
-                try:
-                    float(row[i].replace(',', ''))
+                if _NUMBER_RE.fullmatch(row[i].replace(',', '')):
                     nums += 1
-                except ValueError:
-                    pass
         dtypes[col] = "numeric" if total > 0 and nums / total > 0.7 else "text"
     return dtypes
 
 
+def _parse_column(rows, idx) -> array:
+    """Column idx as float64, NaN where a cell is missing or not a number."""
+    try:
+        # Clean columns convert entirely in C; the first bad cell drops to the per-cell loop
+        return array('d', map(float, map(itemgetter(idx), rows)))
+    except (ValueError, IndexError, TypeError):
+        pass
+    out = array('d', [_NAN]) * len(rows)
+    for i, row in enumerate(rows):
+        try: out[i] = float(row[idx].replace(',', ''))
+        except (ValueError, IndexError, AttributeError): pass
+    return out
+
+
+def _build_arrays(columns, rows, dtypes) -> dict:
+    arrays = {}
+    for i, col in enumerate(columns):
+        if dtypes.get(col) == "numeric" and col not in arrays:
+            arrays[col] = _parse_column(rows, i)
+    return arrays
+
+
+def _index_columns(columns) -> dict:
+    index = {}
+    for i, col in enumerate(columns):
+        index.setdefault(col, i)  # first occurrence wins, as with list.index
+    return index
+
+
+def _col_index(data: dict) -> dict:
+    index = data.get("col_index")
+    if index is None:
+        index = data["col_index"] = _index_columns(data["columns"])
+    return index
+
+
+def _numeric(data: dict, col_name: str) -> array:
+    arr = data.get("arrays", {}).get(col_name)
+    if arr is None:
+        # Text columns charted as numbers are parsed on first use, then memoized
+        cache = data.setdefault("_numeric_cache", {})
+        arr = cache.get(col_name)
+        if arr is None:
+            arr = cache[col_name] = _parse_column(data["rows"], _col_index(data)[col_name])
+    return arr
+
+
+def _value_counts(data: dict, col_name: str) -> Counter:
+    """Occurrences of each raw cell value (short rows count as ""), memoized per column."""
+    cache = data.setdefault("_counts_cache", {})
+    counts = cache.get(col_name)
+    if counts is None:
+        idx = _col_index(data)[col_name]
+        counts = cache[col_name] = Counter(row[idx] if idx < len(row) else "" for row in data["rows"])
+    return counts
+
+
+def _blank_count(data: dict, col_name: str) -> int:
+    """Cells of the column that are missing or whitespace-only, without hashing the rest."""
+    counts = data.get("_counts_cache", {}).get(col_name)
+    if counts is not None:
+        return sum(c for v, c in counts.items() if not v.strip())
+    idx = _col_index(data)[col_name]
+    return sum(1 for row in data["rows"] if idx >= len(row) or not row[idx].strip())
+
+
+def _text_freq(counts: Counter) -> Counter:
+    """Fold raw value counts into counts of the stripped, non-blank values."""
+    freq = Counter()
+    for v, c in counts.items():
+        v = v.strip()
+        if v: freq[v] += c
+    return freq
+
+
 # ── Column Statistics ───────────────────────────────────────────
 
-def compute_column_stats(data: dict, col_name: str) -> dict:
-    if col_name not in data["columns"]:
+def compute_column_stats(data: dict, col_name: str, unique: bool = True) -> dict:
+    """Stats for one column. unique=False leaves out the "unique" count, so a
+    numeric column is summarized from its float array without hashing every cell."""
+    if col_name not in _col_index(data):
         return {}
-    idx = data["columns"].index(col_name)
-    raw = [row[idx] if idx < len(row) else "" for row in data["rows"]]
     dtype = data["dtypes"].get(col_name, "text")
+    total_rows = len(data["rows"])
+    if unique or dtype != "numeric":
+        # One hashing pass over the cells; everything below works on the distinct values
+        counts = _value_counts(data, col_name)
+        empty = sum(c for v, c in counts.items() if not v.strip())
+    else:
+        counts = None
+        empty = _blank_count(data, col_name)
     stats = {
         "column": col_name, "type": dtype,
-        "total_rows": len(raw),
-        "non_empty": sum(1 for v in raw if v.strip()),
-        "empty": sum(1 for v in raw if not v.strip()),
-        "unique": len(set(raw)),
+        "total_rows": total_rows,
+        "non_empty": total_rows - empty,
+        "empty": empty,
     }
+    if counts is not None:
+        stats["unique"] = len(counts)
     if dtype == "numeric":
-        values = []
-        for v in raw:
-            try: values.append(float(v.replace(',', '')))
-            except (ValueError, AttributeError): pass
-        if values:
-            vs = sorted(values)
+        vs = [v for v in _numeric(data, col_name) if v == v]
+        if vs:
+            # Sorted once, in place: min/max are its ends, quantiles index into it
+            vs.sort()
             n = len(vs)
+            total = _fsum(vs)
+            mean = _mean(vs)
+            m2, m3 = _central_moments(vs, mean)
+            variance = m2 / (n - 1) if n > 1 else 0
+            stdev = math.sqrt(variance)
             stats.update({
-                "count": n, "sum": sum(values),
-                "mean": statistics.mean(values),
-                "median": statistics.median(values),
-                "stdev": statistics.stdev(values) if n > 1 else 0,
-                "variance": statistics.variance(values) if n > 1 else 0,
-                "min": min(values), "max": max(values),
-                "range": max(values) - min(values),
-                "q1": vs[n // 4] if n >= 4 else vs[0],
-                "q3": vs[3 * n // 4] if n >= 4 else vs[-1],
-                "skewness": _skewness(values) if n > 2 else 0,
+                "count": n, "sum": total,
+                "mean": mean,
+                "median": _quantile(vs, 0.5),
+                "stdev": stdev,
+                "variance": variance,
+                "min": vs[0], "max": vs[-1],
+                "range": vs[-1] - vs[0],
+                "q1": _quantile(vs, 0.25),
+                "q3": _quantile(vs, 0.75),
+                "skewness": (n / ((n - 1) * (n - 2))) * m3 / (stdev * stdev * stdev) if n > 2 and stdev else 0,
             })
     else:
-        freq = {}
-        for v in raw:
-            v = v.strip()
-            if v: freq[v] = freq.get(v, 0) + 1
-        stats["top_values"] = sorted(freq.items(), key=lambda x: -x[1])[:10]
+        freq = _text_freq(counts)
+        stats["top_values"] = freq.most_common(10)
         stats["distinct_count"] = len(freq)
     return stats
 
 
-def _skewness(values):
+def _fsum(values) -> float:
+    """math.fsum, or plain sum() when fsum can't cope (a partial past the float max, inf - inf)."""
+    try:
+        return math.fsum(values)
+    except (OverflowError, ValueError):
+        return sum(values)
+
+
+def _mean(values) -> float:
     n = len(values)
-    if n < 3: return 0
-    m, s = statistics.mean(values), statistics.stdev(values)
-    if s == 0: return 0
-    return (n / ((n - 1) * (n - 2))) * sum(((x - m) / s) ** 3 for x in values)
+    try:
+        return math.fsum(values) / n
+    except OverflowError:
+        # The total passes the float max even though the mean doesn't; sum scaled values
+        return math.fsum(v / n for v in values)
+    except ValueError:
+        return sum(values) / n
+
+
+def _central_moments(values, mean):
+    """Sums of squared and cubed deviations, sharing one deviation list."""
+    d = [v - mean for v in values]
+    d2 = list(map(mul, d, d))
+    return sum(d2), sum(map(mul, d2, d))
+
+
+def _quantile(vs, q):
+    """Linearly interpolated quantile of an already sorted list (numpy's default method)."""
+    pos = (len(vs) - 1) * q
+    lo = int(pos)
+    if lo + 1 >= len(vs):
+        return vs[lo]
+    return vs[lo] + (vs[lo + 1] - vs[lo]) * (pos - lo)
 
 
 def compute_cross_file_stats(datasets: list, col_name: str) -> dict:
     all_values, per_file = [], {}
     for ds in datasets:
-        if col_name in ds["columns"] and ds["dtypes"].get(col_name) == "numeric":
-            idx = ds["columns"].index(col_name)
-            vals = []
-            for row in ds["rows"]:
-                try: vals.append(float(row[idx].replace(',', '')))
-                except (ValueError, IndexError, AttributeError): pass
+        if col_name in _col_index(ds) and ds["dtypes"].get(col_name) == "numeric":
+            vals = [v for v in _numeric(ds, col_name) if v == v]
             per_file[ds["name"]] = vals
             all_values.extend(vals)
     if not all_values:
         return {"column": col_name, "error": "No numeric data"}
+    all_values.sort()  # in place — it is our own merged list
+    vs = all_values
+    n = len(vs)
+    mean = _mean(vs)
     result = {
-        "column": col_name, "total_values": len(all_values), "files": len(per_file),
-        "global_mean": statistics.mean(all_values),
-        "global_median": statistics.median(all_values),
-        "global_min": min(all_values), "global_max": max(all_values),
-        "global_stdev": statistics.stdev(all_values) if len(all_values) > 1 else 0,
+        "column": col_name, "total_values": n, "files": len(per_file),
+        "global_mean": mean,
+        "global_median": _quantile(vs, 0.5),
+        "global_min": vs[0], "global_max": vs[-1],
+        "global_stdev": math.sqrt(_central_moments(vs, mean)[0] / (n - 1)) if n > 1 else 0,
         "per_file": {},
     }
     for fname, vals in per_file.items():
         if vals:
             result["per_file"][fname] = {
-                "count": len(vals), "mean": statistics.mean(vals),
+                "count": len(vals), "mean": _mean(vals),
                 "min": min(vals), "max": max(vals),
             }
     return result
@@ -179,11 +296,7 @@ def compute_cross_file_stats(datasets: list, col_name: str) -> dict:
 # ── Chart Data Generators ───────────────────────────────────────
 
 def histogram_data(data: dict, col_name: str, bins: int = 20) -> dict:
-    idx = data["columns"].index(col_name)
-    values = []
-    for row in data["rows"]:
-        try: values.append(float(row[idx].replace(',', '')))
-        except (ValueError, IndexError, AttributeError): pass
+    values = [v for v in _numeric(data, col_name) if v == v]
     if not values:
         return {"bins": [], "counts": []}
     vmin, vmax = min(values), max(values)
@@ -191,49 +304,33 @@ def histogram_data(data: dict, col_name: str, bins: int = 20) -> dict:
         return {"bins": [vmin], "counts": [len(values)]}
     width = (vmax - vmin) / bins
     bin_edges = [vmin + i * width for i in range(bins + 1)]
-    counts = [0] * bins
-    for v in values:
-        b = min(int((v - vmin) / width), bins - 1)
-        counts[b] += 1
+    # Tally bucket indices in C; values at vmax land on index `bins`, fold them into the last bin
+    hits = Counter(int((v - vmin) / width) for v in values)
+    counts = [hits.get(i, 0) for i in range(bins)]
+    counts[-1] += hits.get(bins, 0)
     return {"bins": bin_edges, "counts": counts, "width": width}
 
 
 def scatter_data(data: dict, col_x: str, col_y: str) -> dict:
-    ix, iy = data["columns"].index(col_x), data["columns"].index(col_y)
-    points = []
-    for row in data["rows"]:
-        try:
-            points.append((float(row[ix].replace(',', '')), float(row[iy].replace(',', ''))))
-        except (ValueError, IndexError, AttributeError):
-            pass
+    xs, ys = _numeric(data, col_x), _numeric(data, col_y)
+    points = [(x, y) for x, y in zip(xs, ys) if x == x and y == y]
     return {"points": points, "x_label": col_x, "y_label": col_y}
 
 
 def bar_data(data: dict, col_name: str, top_n: int = 15) -> dict:
-    idx = data["columns"].index(col_name)
-    freq = {}
-    for row in data["rows"]:
-        try:
-            v = row[idx].strip()
-            if v: freq[v] = freq.get(v, 0) + 1
-        except IndexError: pass
-    top = sorted(freq.items(), key=lambda x: -x[1])[:top_n]
+    top = _text_freq(_value_counts(data, col_name)).most_common(top_n)
     return {"labels": [t[0] for t in top], "values": [t[1] for t in top]}
 
 
 def line_data(data: dict, col_name: str) -> dict:
-    idx = data["columns"].index(col_name)
-    values = []
-    for row in data["rows"]:
-        try: values.append(float(row[idx].replace(',', '')))
-        except (ValueError, IndexError, AttributeError): values.append(None)
+    values = [v if v == v else None for v in _numeric(data, col_name)]
     return {"values": values, "label": col_name}
 
 
 def multi_line_data(datasets: list, col_name: str) -> dict:
     series = {}
     for ds in datasets:
-        if col_name in ds["columns"]:
+        if col_name in _col_index(ds):
             series[ds["name"]] = line_data(ds, col_name)["values"]
     return {"series": series, "label": col_name}
 
@@ -242,26 +339,26 @@ def correlation_matrix(data: dict) -> dict:
     num_cols = [c for c in data["columns"] if data["dtypes"].get(c) == "numeric"]
     if len(num_cols) < 2:
         return {"columns": num_cols, "matrix": []}
-    arrays = {}
+    # Missing or unparseable cells count as 0. Center each column once, then every
+    # pair is one C-level dot product instead of k² passes of statistics.mean/stdev.
+    centered, sumsq = {}, {}
     for col in num_cols:
-        idx = data["columns"].index(col)
-        arrays[col] = [
-            (lambda v: float(v.replace(',', '')) if v.strip() else 0)(row[idx] if idx < len(row) else "0")
-            for row in data["rows"]
-        ]
-    n = len(data["rows"])
-    matrix = []
-    for c1 in num_cols:
-        row = []
-        for c2 in num_cols:
-            if c1 == c2:
-                row.append(1.0)
-            else:
-                a, b = arrays[c1], arrays[c2]
-                ma, mb = statistics.mean(a), statistics.mean(b)
-                sa = statistics.stdev(a) or 1
-                sb = statistics.stdev(b) or 1
-                corr = sum((a[i] - ma) * (b[i] - mb) for i in range(n)) / ((n - 1) * sa * sb)
-                row.append(round(max(-1, min(1, corr)), 4))
-        matrix.append(row)
+        a = [v if v == v else 0.0 for v in _numeric(data, col)]
+        top = max(map(abs, a), default=0.0)
+        if top and math.isfinite(top):
+            # Correlation is scale-free: an exact power-of-two rescale into [-1, 1]
+            # keeps the centered values and their products from overflowing
+            scale = math.ldexp(1.0, -math.frexp(top)[1])
+            a = [v * scale for v in a]
+        m = _mean(a) if a else 0.0
+        d = [v - m for v in a]
+        centered[col], sumsq[col] = d, sum(map(mul, d, d))
+    k = len(num_cols)
+    matrix = [[1.0] * k for _ in range(k)]
+    for i in range(k):
+        for j in range(i + 1, k):
+            c1, c2 = num_cols[i], num_cols[j]
+            den = math.sqrt(sumsq[c1] * sumsq[c2])
+            corr = sum(map(mul, centered[c1], centered[c2])) / den if den else 0.0
+            matrix[i][j] = matrix[j][i] = round(max(-1, min(1, corr)), 4)
     return {"columns": num_cols, "matrix": matrix}